@@ -6,7 +6,7 @@ import time
 from nostr_simulator.anti_spam.pow import ProofOfWorkStrategy
 from nostr_simulator.anti_spam.rate_limiting import TokenBucketRateLimiting
 from nostr_simulator.anti_spam.wot import WebOfTrustStrategy
-from nostr_simulator.config import Config
+from nostr_simulator.config import Config, SimulationConfig
 from nostr_simulator.metrics.core_metrics import CoreMetricsCollector
 from nostr_simulator.protocol.events import NostrEvent, NostrEventKind
 from nostr_simulator.protocol.keys import NostrKeyPair
@@ -317,9 +317,9 @@ def demo_enhanced_engine() -> None:
     print("=" * 50)
 
     # Create configuration
-    config = Config()
-    config.simulation.duration = 60.0  # 1 minute simulation
-    config.simulation.time_step = 0.1
+    config = Config(
+        simulation=SimulationConfig(duration=60.0, time_step=0.1)  # 1 minute
+    )
 
     # Create enhanced engine
     engine = EnhancedSimulationEngine(config)
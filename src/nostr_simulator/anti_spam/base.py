@@ -9,7 +9,7 @@ from typing import Any
 from ..protocol.events import NostrEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyResult:
     """Result of applying an anti-spam strategy."""
 
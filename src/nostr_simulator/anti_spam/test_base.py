@@ -34,6 +34,14 @@ class TestStrategyResult:
         assert result.metrics is None
         assert result.computational_cost == 0.0
 
+    def test_strategy_result_uses_slots(self) -> None:
+        """Test that results carry no per-instance __dict__."""
+        result = StrategyResult(allowed=True, reason="ok")
+
+        assert not hasattr(result, "__dict__")
+        result.metrics = {"latency": 0.1}  # Fields stay assignable
+        assert result.metrics == {"latency": 0.1}
+
 
 class MockStrategy(AntiSpamStrategy):
     """Mock strategy for testing."""
@@ -4,18 +4,35 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import Annotated
 
 import yaml
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    PositiveFloat,
+    PositiveInt,
+    ValidationError,
+    validator,
+)
+
+# Probability-like values constrained to the closed interval [0, 1].
+Probability = Annotated[float, Field(ge=0, le=1)]
 
 
 class SimulationConfig(BaseModel):
     """Configuration for simulation parameters."""
 
-    duration: float = Field(
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    duration: PositiveFloat = Field(
         default=3600.0, description="Simulation duration in seconds"
     )
-    time_step: float = Field(default=1.0, description="Simulation time step in seconds")
+    time_step: PositiveFloat = Field(
+        default=1.0, description="Simulation time step in seconds"
+    )
     random_seed: int | None = Field(
         default=None, description="Random seed for reproducibility"
     )
@@ -23,88 +40,49 @@ class SimulationConfig(BaseModel):
         default=None, description="Maximum number of events to process"
     )
 
-    @validator("duration")
-    def duration_must_be_positive(cls, v: float) -> float:
-        """Validate that duration is positive."""
-        if v <= 0:
-            raise ValueError("Duration must be positive")
-        return v
-
-    @validator("time_step")
-    def time_step_must_be_positive(cls, v: float) -> float:
-        """Validate that time step is positive."""
-        if v <= 0:
-            raise ValueError("Time step must be positive")
-        return v
-
 
 class NetworkConfig(BaseModel):
     """Configuration for network topology."""
 
-    num_relays: int = Field(default=10, description="Number of relay nodes")
-    num_honest_users: int = Field(default=100, description="Number of honest users")
-    num_malicious_users: int = Field(
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    num_relays: NonNegativeInt = Field(default=10, description="Number of relay nodes")
+    num_honest_users: NonNegativeInt = Field(
+        default=100, description="Number of honest users"
+    )
+    num_malicious_users: NonNegativeInt = Field(
         default=10, description="Number of malicious users"
     )
-    connection_probability: float = Field(
+    connection_probability: Probability = Field(
         default=0.3, description="Probability of connection between nodes"
     )
 
-    @validator("num_relays", "num_honest_users", "num_malicious_users")
-    def counts_must_be_positive(cls, v: int) -> int:
-        """Validate that counts are positive."""
-        if v < 0:
-            raise ValueError("Counts must be non-negative")
-        return v
-
-    @validator("connection_probability")
-    def probability_must_be_valid(cls, v: float) -> float:
-        """Validate that probability is between 0 and 1."""
-        if not 0 <= v <= 1:
-            raise ValueError("Probability must be between 0 and 1")
-        return v
-
 
 class AntiSpamConfig(BaseModel):
     """Configuration for anti-spam strategies."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     enabled_strategies: list[str] = Field(
         default_factory=lambda: ["rate_limiting"],
         description="List of enabled anti-spam strategies",
     )
-    pow_difficulty: int = Field(default=4, description="Proof of Work difficulty")
-    rate_limit_per_second: float = Field(
+    pow_difficulty: NonNegativeInt = Field(
+        default=4, description="Proof of Work difficulty"
+    )
+    rate_limit_per_second: PositiveFloat = Field(
         default=1.0, description="Rate limit events per second"
     )
-    wot_trust_threshold: float = Field(
+    wot_trust_threshold: Probability = Field(
         default=0.5, description="Web of Trust threshold"
     )
 
-    @validator("pow_difficulty")
-    def pow_difficulty_must_be_positive(cls, v: int) -> int:
-        """Validate that PoW difficulty is positive."""
-        if v < 0:
-            raise ValueError("PoW difficulty must be non-negative")
-        return v
-
-    @validator("rate_limit_per_second")
-    def rate_limit_must_be_positive(cls, v: float) -> float:
-        """Validate that rate limit is positive."""
-        if v <= 0:
-            raise ValueError("Rate limit must be positive")
-        return v
-
-    @validator("wot_trust_threshold")
-    def trust_threshold_must_be_valid(cls, v: float) -> float:
-        """Validate that trust threshold is between 0 and 1."""
-        if not 0 <= v <= 1:
-            raise ValueError("Trust threshold must be between 0 and 1")
-        return v
-
 
 class AttackConfig(BaseModel):
     """Configuration for attack scenarios."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     sybil_attack_enabled: bool = Field(
         default=False, description="Enable Sybil attacks"
     )
@@ -118,43 +96,24 @@ class AttackConfig(BaseModel):
         default=False, description="Enable offline abuse"
     )
 
-    sybil_identities_per_attacker: int = Field(
+    sybil_identities_per_attacker: PositiveInt = Field(
         default=10, description="Number of identities per Sybil attacker"
     )
-    burst_spam_rate: float = Field(
+    burst_spam_rate: PositiveFloat = Field(
         default=10.0, description="Burst spam rate (events per second)"
     )
-    burst_duration: float = Field(
+    burst_duration: PositiveFloat = Field(
         default=60.0, description="Duration of burst attacks in seconds"
     )
 
-    @validator("sybil_identities_per_attacker")
-    def sybil_identities_must_be_positive(cls, v: int) -> int:
-        """Validate that Sybil identities count is positive."""
-        if v <= 0:
-            raise ValueError("Sybil identities count must be positive")
-        return v
-
-    @validator("burst_spam_rate")
-    def burst_rate_must_be_positive(cls, v: float) -> float:
-        """Validate that burst spam rate is positive."""
-        if v <= 0:
-            raise ValueError("Burst spam rate must be positive")
-        return v
-
-    @validator("burst_duration")
-    def burst_duration_must_be_positive(cls, v: float) -> float:
-        """Validate that burst duration is positive."""
-        if v <= 0:
-            raise ValueError("Burst duration must be positive")
-        return v
-
 
 class MetricsConfig(BaseModel):
     """Configuration for metrics collection."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     enabled: bool = Field(default=True, description="Enable metrics collection")
-    collection_interval: float = Field(
+    collection_interval: PositiveFloat = Field(
         default=10.0, description="Metrics collection interval in seconds"
     )
     output_format: str = Field(
@@ -162,13 +121,6 @@ class MetricsConfig(BaseModel):
     )
     output_file: str | None = Field(default=None, description="Output file path")
 
-    @validator("collection_interval")
-    def interval_must_be_positive(cls, v: float) -> float:
-        """Validate that collection interval is positive."""
-        if v <= 0:
-            raise ValueError("Collection interval must be positive")
-        return v
-
     @validator("output_format")
     def output_format_must_be_valid(cls, v: str) -> str:
         """Validate that output format is supported."""
@@ -181,22 +133,26 @@ class MetricsConfig(BaseModel):
 class Config(BaseModel):
     """Main configuration class for the Nostr Simulator."""
 
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
     simulation: SimulationConfig = Field(default_factory=SimulationConfig)
     network: NetworkConfig = Field(default_factory=NetworkConfig)
     antispam: AntiSpamConfig = Field(default_factory=AntiSpamConfig)
     attacks: AttackConfig = Field(default_factory=AttackConfig)
     metrics: MetricsConfig = Field(default_factory=MetricsConfig)
 
-    class Config:
-        """Pydantic configuration."""
 
-        extra = "forbid"
-        validate_assignment = True
+# Shared default configuration returned when no config file is configured.
+# Safe to share because configuration models are frozen.
+_DEFAULT_CONFIG = Config()
 
 
 def load_config(config_path: str | Path) -> Config:
     """Load configuration from a YAML file.
 
+    Files that are plain JSON (a ``.json`` suffix or a leading ``{``) are
+    validated directly by pydantic's JSON parser, skipping PyYAML.
+
     Args:
         config_path: Path to the configuration file.
 
@@ -211,8 +167,17 @@ def load_config(config_path: str | Path) -> Config:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_file) as f:
-        config_data = yaml.safe_load(f)
+    raw = config_file.read_bytes()
+    if config_file.suffix == ".json" or raw.lstrip().startswith(b"{"):
+        try:
+            return Config.model_validate_json(raw)
+        except ValidationError as e:
+            # YAML flow mappings also start with "{"; only fall back to the
+            # YAML parser when the content is not valid JSON.
+            if e.errors()[0]["type"] != "json_invalid":
+                raise
+
+    config_data = yaml.safe_load(raw)
 
     return Config(**config_data)
 
@@ -224,12 +189,12 @@ def load_config_from_env(env_var: str = "NOSTR_SIM_CONFIG") -> Config:
         env_var: Environment variable containing the config file path.
 
     Returns:
-        Loaded configuration object or default configuration.
+        Loaded configuration object or the shared default configuration.
     """
     config_path = os.getenv(env_var)
-    if config_path:
-        return load_config(config_path)
-    return Config()
+    if not config_path:
+        return _DEFAULT_CONFIG
+    return load_config(config_path)
 
 
 def save_config(config: Config, config_path: str | Path) -> None:
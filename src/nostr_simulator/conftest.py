@@ -0,0 +1,20 @@
+"""Shared pytest fixtures for the Nostr Simulator test suite."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from .config import Config
+from .protocol.keys import NostrKeyPair
+
+
+@pytest.fixture
+def mock_config() -> Mock:
+    """Provide a fresh spec'd Config mock for each test."""
+    return Mock(spec=Config)
+
+
+@pytest.fixture(scope="session")
+def shared_keypair() -> NostrKeyPair:
+    """Provide one key pair for tests that only sign or read it."""
+    return NostrKeyPair.generate()
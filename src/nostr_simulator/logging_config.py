@@ -1,13 +1,127 @@
 """Logging configuration for the Nostr Simulator."""
 
+import atexit
+import copy
+import json
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Background listeners that write queued records to file handlers.
+_QUEUE_LISTENERS: list[logging.handlers.QueueListener] = []
+
+
+def _create_log_directories(config: dict[str, Any]) -> None:
+    """Create parent directories for every file-based handler.
+
+    Args:
+        config: Logging configuration dictionary.
+    """
+    for handler in config.get("handlers", {}).values():
+        filename = handler.get("filename")
+        if not filename:
+            continue
+        Path(filename).parent.mkdir(parents=True, exist_ok=True)
+
+
+def _stop_queue_listeners() -> None:
+    """Flush and stop all running queue listeners."""
+    while _QUEUE_LISTENERS:
+        _QUEUE_LISTENERS.pop().stop()
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener's handlers.
+
+    The stock ``prepare`` formats the record and clears ``exc_info``, which
+    would hide tracebacks from formatters such as ``JsonFormatter``.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge the message arguments but keep exception information.
+
+        Args:
+            record: Log record about to be enqueued.
+
+        Returns:
+            Copy of the record with its message already interpolated.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _enqueue_file_handlers(config: dict[str, Any]) -> None:
+    """Move file handlers of configured loggers behind a queue listener.
+
+    Each logger's file handlers are replaced by a queue handler so that
+    emitting a record only enqueues it; a ``QueueListener`` thread performs
+    the disk writes. Loggers sharing the same file handlers share one queue.
+
+    Args:
+        config: Logging configuration dictionary that was just applied.
+    """
+    logger_names = list(config.get("loggers", {}))
+    if "root" in config:
+        logger_names.append("")
+
+    queue_handlers: dict[tuple[logging.Handler, ...], logging.Handler] = {}
+    for name in logger_names:
+        logger = logging.getLogger(name)
+        file_handlers = tuple(
+            h for h in logger.handlers if isinstance(h, logging.FileHandler)
+        )
+        if not file_handlers:
+            continue
+
+        queue_handler = queue_handlers.get(file_handlers)
+        if queue_handler is None:
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            queue_handler = _RecordQueueHandler(log_queue)
+            listener = logging.handlers.QueueListener(
+                log_queue, *file_handlers, respect_handler_level=True
+            )
+            listener.start()
+            _QUEUE_LISTENERS.append(listener)
+            queue_handlers[file_handlers] = queue_handler
+
+        for handler in file_handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+
+
+atexit.register(_stop_queue_listeners)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a log record to JSON.
+
+        Args:
+            record: Log record to format.
+
+        Returns:
+            JSON-encoded log line.
+        """
+        payload = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload)
+
 
 def setup_logging(
     config_path: str = "logging.yaml",
@@ -16,6 +130,9 @@ def setup_logging(
 ) -> None:
     """Set up logging configuration.
 
+    File handlers from a configuration file are served by a background
+    ``QueueListener`` so logging calls do not block on disk I/O.
+
     Args:
         config_path: Path to the logging configuration file.
         default_level: Default logging level if no config file is found.
@@ -31,7 +148,10 @@ def setup_logging(
     if config_file.exists():
         with open(config_file) as f:
             config = yaml.safe_load(f.read())
+        _create_log_directories(config)
+        _stop_queue_listeners()
         logging.config.dictConfig(config)
+        _enqueue_file_handlers(config)
     else:
         # Fallback to basic configuration
         logging.basicConfig(
@@ -65,9 +185,7 @@ DEFAULT_LOGGING_CONFIG: dict[str, Any] = {
         "detailed": {
             "format": "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s"
         },
-        "json": {
-            "format": '{"timestamp": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "message": "%(message)s"}'
-        },
+        "json": {"()": "nostr_simulator.logging_config.JsonFormatter"},
     },
     "handlers": {
         "console": {
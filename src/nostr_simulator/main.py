@@ -1,22 +1,32 @@
 """Main entry point for the Nostr Simulator."""
 
+from __future__ import annotations
+
 import sys
+from typing import TYPE_CHECKING
 
-from .agents.base import AgentManager
 from .config import Config, load_config_from_env
 from .logging_config import get_logger, setup_logging
-from .simulation.engine import SimulationEngine
+
+if TYPE_CHECKING:
+    from .simulation.engine import SimulationEngine
 
 
 def create_simulation(config: Config) -> SimulationEngine:
     """Create and configure a simulation engine.
 
+    The engine and agent modules are imported here rather than at module
+    load so that logging is configured before their import graph runs.
+
     Args:
         config: Simulation configuration.
 
     Returns:
         Configured simulation engine.
     """
+    from .agents.base import AgentManager
+    from .simulation.engine import SimulationEngine
+
     # Create simulation engine
     engine = SimulationEngine(config)
 
@@ -1,13 +1,21 @@
 """Comprehensive metrics system for Nostr simulator."""
 
-from .core_metrics import (
-    CoreMetricsCollector,
-    FalsePositiveNegativeTracker,
-    LatencyMeasurement,
-    RelayLoadMonitor,
-    ResilienceMetrics,
-    SpamReductionCalculator,
-)
+from __future__ import annotations
+
+import importlib.util
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .core_metrics import (
+        CoreMetricsCollector,
+        FalsePositiveNegativeTracker,
+        LatencyMeasurement,
+        RelayLoadMonitor,
+        ResilienceMetrics,
+        SpamReductionCalculator,
+    )
 
 __all__ = [
     "CoreMetricsCollector",
@@ -17,3 +25,44 @@ __all__ = [
     "ResilienceMetrics",
     "SpamReductionCalculator",
 ]
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """Register a submodule whose body only runs on first attribute access.
+
+    Args:
+        name: Submodule name relative to this package.
+
+    Returns:
+        The (possibly not yet executed) submodule.
+    """
+    fullname = f"{__name__}.{name}"
+    if fullname in sys.modules:
+        return sys.modules[fullname]
+
+    spec = importlib.util.find_spec(fullname)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named {fullname!r}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[fullname] = module
+    loader.exec_module(module)
+    return module
+
+
+_core_metrics = _lazy_import("core_metrics")
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve exports from ``core_metrics``, loading it on first use."""
+    if name in __all__:
+        value = getattr(_core_metrics, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including the lazily imported exports."""
+    return sorted({*globals(), *__all__})
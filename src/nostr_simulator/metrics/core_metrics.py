@@ -2,17 +2,30 @@
 
 from __future__ import annotations
 
+import bisect
+import math
+import sys
 import time
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+import numpy.typing as npt
+
 from ..anti_spam.base import StrategyResult
 from ..logging_config import get_logger
 from ..protocol.events import NostrEvent
 
+logger = get_logger(__name__)
+
+# Attack types that count towards the offline detection rate
+_OFFLINE_ATTACK_TYPES = frozenset({"offline_sybil", "offline_spam", "offline_replay"})
 
-@dataclass
+
+@dataclass(slots=True)
 class FalsePositiveNegativeStats:
     """Statistics for false positives and negatives."""
 
@@ -35,9 +48,10 @@ class FalsePositiveNegativeStats:
 
     @property
     def f1_score(self) -> float:
-        """Calculate F1 score (2 * precision * recall / (precision + recall))."""
-        p, r = self.precision, self.recall
-        return 2 * p * r / (p + r) if (p + r) > 0 else 0.0
+        """Calculate F1 score (2TP / (2TP + FP + FN))."""
+        doubled_tp = 2 * self.true_positives
+        denominator = doubled_tp + self.false_positives + self.false_negatives
+        return doubled_tp / denominator if denominator > 0 else 0.0
 
     @property
     def accuracy(self) -> float:
@@ -51,80 +65,251 @@ class FalsePositiveNegativeStats:
         return (self.true_positives + self.true_negatives) / total if total > 0 else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class RelayLoadStats:
     """Statistics for relay computational and bandwidth load."""
 
     total_cpu_time: float = 0.0  # Total CPU time in seconds
     total_bandwidth_bytes: int = 0  # Total bandwidth used in bytes
-    event_processing_times: list[float] = field(
-        default_factory=list
-    )  # Individual event processing times
+    event_count: int = 0  # Number of processed events
     peak_cpu_usage: float = 0.0  # Peak CPU usage percentage
     peak_bandwidth_rate: float = 0.0  # Peak bandwidth rate in bytes/second
 
     @property
     def average_cpu_time_per_event(self) -> float:
         """Calculate average CPU time per event."""
-        return (
-            self.total_cpu_time / len(self.event_processing_times)
-            if self.event_processing_times
-            else 0.0
-        )
+        return self.total_cpu_time / self.event_count if self.event_count else 0.0
 
     @property
     def average_bandwidth_per_event(self) -> float:
         """Calculate average bandwidth per event."""
         return (
-            self.total_bandwidth_bytes / len(self.event_processing_times)
-            if self.event_processing_times
-            else 0.0
+            self.total_bandwidth_bytes / self.event_count if self.event_count else 0.0
         )
 
 
-@dataclass
+class LatencySketch:
+    """Streaming quantile sketch over log-spaced latency buckets.
+
+    Each value is counted in bucket ``ceil(log(value) / log(gamma))``, so
+    quantile estimates stay within ``relative_accuracy`` of the exact value.
+    Values below ``min_value`` are counted as zero and values above
+    ``max_value`` share the top bucket, which caps the number of buckets
+    regardless of how many samples are recorded.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "min_value",
+        "gamma",
+        "_log_gamma",
+        "_max_key",
+        "buckets",
+        "zero_count",
+        "count",
+        "mean",
+        "_sorted_keys",
+        "_quantile_cache",
+        "_quantile_cache_count",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 3600.0,
+    ) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates.
+            min_value: Smallest value given its own bucket, in seconds.
+            max_value: Largest value given its own bucket, in seconds.
+        """
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self._max_key = math.ceil(math.log(max_value) / self._log_gamma)
+        self.buckets: dict[int, int] = {}  # bucket key -> sample count
+        self.zero_count = 0  # Samples below min_value
+        self.count = 0
+        self.mean = 0.0  # Welford running mean of all samples
+        self._sorted_keys: list[int] | None = None  # Reset when a bucket is added
+        self._quantile_cache: dict[float, float] = {}  # Valid for one sample count
+        self._quantile_cache_count = 0
+
+    def __len__(self) -> int:
+        """Return the number of recorded samples."""
+        return self.count
+
+    def add(self, value: float) -> None:
+        """Record a sample.
+
+        Args:
+            value: The latency value in seconds.
+        """
+        self.count += 1
+        self.mean += (value - self.mean) / self.count
+        if value < self.min_value:
+            self.zero_count += 1
+            return
+        key = min(math.ceil(math.log(value) / self._log_gamma), self._max_key)
+        bucket_count = self.buckets.get(key)
+        if bucket_count is None:
+            self.buckets[key] = 1
+            self._sorted_keys = None
+        else:
+            self.buckets[key] = bucket_count + 1
+
+    def add_many(self, values: npt.ArrayLike) -> None:
+        """Record a batch of samples with vectorized bucketing.
+
+        Args:
+            values: Latency values in seconds.
+        """
+        samples = np.asarray(values, dtype=np.float64).ravel()
+        if not samples.size:
+            return
+        self.count += samples.size
+        self.mean += (float(samples.mean()) - self.mean) * samples.size / self.count
+
+        bucketed = samples[samples >= self.min_value]
+        self.zero_count += samples.size - bucketed.size
+        keys = np.minimum(np.ceil(np.log(bucketed) / self._log_gamma), self._max_key)
+        unique_keys, key_counts = np.unique(keys.astype(np.int64), return_counts=True)
+        buckets = self.buckets
+        for key, key_count in zip(
+            unique_keys.tolist(), key_counts.tolist(), strict=True
+        ):
+            bucket_count = buckets.get(key)
+            if bucket_count is None:
+                buckets[key] = key_count
+                self._sorted_keys = None
+            else:
+                buckets[key] = bucket_count + key_count
+
+    @property
+    def sum(self) -> float:
+        """Calculate the sum of the recorded samples."""
+        return self.mean * self.count
+
+    def _sorted_bucket_keys(self) -> list[int]:
+        """Return the occupied bucket keys in ascending order.
+
+        The sorted keys are cached until a sample opens a new bucket.
+        """
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self.buckets)
+        return self._sorted_keys
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile of the recorded samples.
+
+        Estimates are remembered until another sample is recorded, so
+        repeated reads of the same percentile do not walk the buckets.
+
+        Args:
+            q: Quantile to estimate, between 0 and 1.
+
+        Returns:
+            The estimated value, or 0.0 if no samples were recorded.
+        """
+        if self._quantile_cache_count != self.count:
+            self._quantile_cache.clear()
+            self._quantile_cache_count = self.count
+        value = self._quantile_cache.get(q)
+        if value is None:
+            value = self._quantile_cache[q] = self.quantiles((q,))[0]
+        return value
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        """Estimate several quantiles in a single pass over the buckets.
+
+        When every requested quantile lies in the upper half, the walk starts
+        from the largest bucket so tail percentiles only touch the tail.
+
+        Args:
+            qs: Quantiles to estimate, each between 0 and 1.
+
+        Returns:
+            The estimated values, in the same order as ``qs``.
+        """
+        results = [0.0] * len(qs)
+        if not self.count:
+            return results
+
+        ranks = [int(q * (self.count - 1)) for q in qs]
+        order = sorted(range(len(ranks)), key=ranks.__getitem__)
+        keys = self._sorted_bucket_keys()
+        key: int | None = None
+
+        if 2 * ranks[order[0]] >= self.count - 1:
+            descending = reversed(keys)
+            covered = 0  # Samples in the buckets walked so far
+            for i in reversed(order):
+                while covered < self.count - ranks[i]:
+                    key = next(descending, None)
+                    if key is None:
+                        break  # Remaining samples are in the zero bucket
+                    covered += self.buckets[key]
+                if key is not None:
+                    results[i] = self._bucket_value(key)
+            return results
+
+        ascending = iter(keys)
+        cumulative = self.zero_count
+        for i in order:
+            while cumulative <= ranks[i]:
+                key = next(ascending)
+                cumulative += self.buckets[key]
+            if key is not None:
+                results[i] = self._bucket_value(key)
+        return results
+
+    def _bucket_value(self, key: int) -> float:
+        """Return the representative value of a bucket.
+
+        Args:
+            key: Bucket key.
+
+        Returns:
+            The value within ``relative_accuracy`` of every sample in the bucket.
+        """
+        return 2 * self.gamma**key / (self.gamma + 1)
+
+
+@dataclass(slots=True)
 class LatencyStats:
     """Statistics for latency measurements."""
 
-    processing_latencies: list[float] = field(
-        default_factory=list
+    processing_latencies: LatencySketch = field(
+        default_factory=LatencySketch
     )  # Event processing latencies
-    validation_latencies: list[float] = field(
-        default_factory=list
+    validation_latencies: LatencySketch = field(
+        default_factory=LatencySketch
     )  # Validation latencies
-    strategy_latencies: dict[str, list[float]] = field(
-        default_factory=lambda: defaultdict(list)
+    strategy_latencies: dict[str, LatencySketch] = field(
+        default_factory=lambda: defaultdict(LatencySketch)
     )  # Per-strategy latencies
 
     @property
     def average_processing_latency(self) -> float:
         """Calculate average processing latency."""
-        return (
-            sum(self.processing_latencies) / len(self.processing_latencies)
-            if self.processing_latencies
-            else 0.0
-        )
+        return self.processing_latencies.mean
 
     @property
     def p95_processing_latency(self) -> float:
         """Calculate 95th percentile processing latency."""
-        if not self.processing_latencies:
-            return 0.0
-        sorted_latencies = sorted(self.processing_latencies)
-        index = min(int(0.95 * (len(sorted_latencies) - 1)), len(sorted_latencies) - 1)
-        return sorted_latencies[index]
+        return self.processing_latencies.quantile(0.95)
 
     @property
     def p99_processing_latency(self) -> float:
         """Calculate 99th percentile processing latency."""
-        if not self.processing_latencies:
-            return 0.0
-        sorted_latencies = sorted(self.processing_latencies)
-        index = min(int(0.99 * (len(sorted_latencies) - 1)), len(sorted_latencies) - 1)
-        return sorted_latencies[index]
+        return self.processing_latencies.quantile(0.99)
 
 
-@dataclass
+@dataclass(slots=True)
 class SpamReductionStats:
     """Statistics for spam reduction effectiveness."""
 
@@ -156,7 +341,7 @@ class SpamReductionStats:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResilienceStats:
     """Statistics for measuring system resilience."""
 
@@ -179,22 +364,62 @@ class ResilienceStats:
         )
 
 
+@dataclass(slots=True)
+class GroundTruthStore:
+    """Ground-truth labels and strategy decisions shared between trackers.
+
+    Labels are keyed by the event's own hex id string. The string is already
+    held by the event and caches its hash, so lookups never rehash it and the
+    store adds no per-event key copies.
+    """
+
+    event_labels: dict[str, bool] = field(default_factory=dict)  # event_id -> is_spam
+    strategy_decisions: dict[str, set[str]] = field(
+        default_factory=lambda: defaultdict(set)
+    )  # strategy -> ids of blocked events
+
+    def record_decision(self, strategy_name: str, event_id: str, blocked: bool) -> None:
+        """Record whether a strategy blocked an event.
+
+        Args:
+            strategy_name: Name of the strategy.
+            event_id: ID of the evaluated event.
+            blocked: True if the event was blocked, False if allowed.
+        """
+        blocked_ids = self.strategy_decisions[strategy_name]
+        if blocked:
+            blocked_ids.add(event_id)
+        else:
+            blocked_ids.discard(event_id)
+
+
 class FalsePositiveNegativeTracker:
     """Tracks false positives and negatives for anti-spam strategies."""
 
-    def __init__(self) -> None:
-        """Initialize the tracker."""
-        self.logger = get_logger(__name__)
+    __slots__ = (
+        "stats_by_strategy",
+        "overall_stats",
+        "ground_truth",
+        "event_labels",
+        "strategy_decisions",
+    )
+
+    def __init__(self, ground_truth: GroundTruthStore | None = None) -> None:
+        """Initialize the tracker.
+
+        Args:
+            ground_truth: Store of labels and decisions to share with other
+                trackers, or None to use a private store.
+        """
         self.stats_by_strategy: dict[str, FalsePositiveNegativeStats] = defaultdict(
             FalsePositiveNegativeStats
         )
         self.overall_stats = FalsePositiveNegativeStats()
 
         # Ground truth tracking
-        self.event_labels: dict[str, bool] = {}  # event_id -> is_spam
-        self.strategy_decisions: dict[str, dict[str, bool]] = defaultdict(
-            dict
-        )  # strategy -> event_id -> blocked
+        self.ground_truth = ground_truth or GroundTruthStore()
+        self.event_labels = self.ground_truth.event_labels
+        self.strategy_decisions = self.ground_truth.strategy_decisions
 
     def label_event(self, event: NostrEvent, is_spam: bool) -> None:
         """Label an event as spam or legitimate for ground truth.
@@ -216,25 +441,74 @@ class FalsePositiveNegativeTracker:
             result: The strategy's decision result.
         """
         blocked = not result.allowed
-        self.strategy_decisions[strategy_name][event.id] = blocked
+        event_id = event.id
+        self.ground_truth.record_decision(strategy_name, event_id, blocked)
 
         # Update stats if we have ground truth
-        if event.id in self.event_labels:
-            is_spam = self.event_labels[event.id]
-            stats = self.stats_by_strategy[strategy_name]
+        is_spam = self.event_labels.get(event_id)
+        if is_spam is not None:
+            self._count_outcome(self.stats_by_strategy[strategy_name], is_spam, blocked)
+
+    def record_outcome(self, strategy_name: str, is_spam: bool, blocked: bool) -> None:
+        """Count a decision on an event whose ground truth is known.
 
-            if is_spam and blocked:
+        Args:
+            strategy_name: Name of the strategy.
+            is_spam: True if the event is spam, False if legitimate.
+            blocked: True if the event was blocked, False if allowed.
+        """
+        self._count_outcome(self.stats_by_strategy[strategy_name], is_spam, blocked)
+
+    def _count_outcome(
+        self, stats: FalsePositiveNegativeStats, is_spam: bool, blocked: bool
+    ) -> None:
+        """Increment the matching counter in a strategy's and the overall stats.
+
+        Args:
+            stats: The strategy's stats.
+            is_spam: True if the event is spam, False if legitimate.
+            blocked: True if the event was blocked, False if allowed.
+        """
+        overall = self.overall_stats
+        if is_spam:
+            if blocked:
                 stats.true_positives += 1
-                self.overall_stats.true_positives += 1
-            elif is_spam and not blocked:
+                overall.true_positives += 1
+            else:
                 stats.false_negatives += 1
-                self.overall_stats.false_negatives += 1
-            elif not is_spam and blocked:
-                stats.false_positives += 1
-                self.overall_stats.false_positives += 1
-            elif not is_spam and not blocked:
-                stats.true_negatives += 1
-                self.overall_stats.true_negatives += 1
+                overall.false_negatives += 1
+        elif blocked:
+            stats.false_positives += 1
+            overall.false_positives += 1
+        else:
+            stats.true_negatives += 1
+            overall.true_negatives += 1
+
+    def record_outcomes_bulk(
+        self, strategy_name: str, is_spam: npt.ArrayLike, blocked: npt.ArrayLike
+    ) -> None:
+        """Count a batch of decisions on events whose ground truth is known.
+
+        The batch is reduced to a confusion matrix with a single
+        ``np.bincount`` over the codes ``2 * is_spam + blocked``.
+
+        Args:
+            strategy_name: Name of the strategy.
+            is_spam: Ground-truth label of each event.
+            blocked: Whether the strategy blocked each event.
+        """
+        labels = np.asarray(is_spam, dtype=np.bool_).ravel()
+        decisions = np.asarray(blocked, dtype=np.bool_).ravel()
+        if labels.size != decisions.size:
+            raise ValueError("is_spam and blocked differ in length")
+        codes = 2 * labels.astype(np.intp) + decisions
+        tn, fp, fn, tp = np.bincount(codes, minlength=4).tolist()
+
+        for stats in (self.stats_by_strategy[strategy_name], self.overall_stats):
+            stats.true_positives += tp
+            stats.true_negatives += tn
+            stats.false_positives += fp
+            stats.false_negatives += fn
 
     def get_stats(self, strategy_name: str | None = None) -> FalsePositiveNegativeStats:
         """Get false positive/negative stats.
@@ -259,26 +533,88 @@ class FalsePositiveNegativeTracker:
         result["overall"] = self.overall_stats
         return result
 
+    def confusion_matrix(self) -> tuple[list[str], npt.NDArray[np.int64]]:
+        """Get every strategy's counters as one matrix.
+
+        Rows follow the returned names, with the overall counters last;
+        columns are true positives, true negatives, false positives and
+        false negatives.
+
+        Returns:
+            Tuple of the row names and an ``(n_strategies + 1, 4)`` matrix.
+        """
+        names = list(self.stats_by_strategy)
+        rows = [*self.stats_by_strategy.values(), self.overall_stats]
+        matrix = np.array(
+            [
+                (
+                    s.true_positives,
+                    s.true_negatives,
+                    s.false_positives,
+                    s.false_negatives,
+                )
+                for s in rows
+            ],
+            dtype=np.int64,
+        )
+        names.append("overall")
+        return names, matrix
+
+    def all_rates(self) -> dict[str, dict[str, float]]:
+        """Get precision, recall, F1 score and accuracy for every strategy.
+
+        All four rates are computed for every row of the confusion matrix
+        at once, so a report reading them does no per-object property work.
+
+        Returns:
+            Dictionary mapping strategy names, plus ``"overall"``, to their
+            ``precision``, ``recall``, ``f1_score`` and ``accuracy``.
+        """
+        names, matrix = self.confusion_matrix()
+        tp, tn, fp, fn = matrix.T.astype(np.float64)
+        numerators = np.stack([tp, tp, 2 * tp, tp + tn])
+        denominators = np.stack([tp + fp, tp + fn, 2 * tp + fp + fn, tp + tn + fp + fn])
+        rates = np.divide(
+            numerators,
+            denominators,
+            out=np.zeros_like(numerators),
+            where=denominators > 0,
+        )
+        keys = ("precision", "recall", "f1_score", "accuracy")
+        return {
+            name: dict(zip(keys, row, strict=True))
+            for name, row in zip(names, rates.T.tolist(), strict=True)
+        }
+
 
 class RelayLoadMonitor:
     """Monitors computational and bandwidth load on relays."""
 
+    __slots__ = (
+        "window_size",
+        "stats",
+        "_window_timestamps",
+        "_window_bytes",
+        "_window_start",
+        "_window_count",
+        "_bandwidth_window_sum",
+    )
+
     def __init__(self, window_size: int = 100) -> None:
         """Initialize the monitor.
 
         Args:
             window_size: Size of the sliding window for rate calculations.
         """
-        self.logger = get_logger(__name__)
         self.window_size = window_size
 
         self.stats = RelayLoadStats()
-        self.recent_processing_times: deque[tuple[float, float]] = deque(
-            maxlen=window_size
-        )  # (timestamp, processing_time)
-        self.recent_bandwidth_usage: deque[tuple[float, int]] = deque(
-            maxlen=window_size
-        )  # (timestamp, bytes)
+        # Ring buffer of (timestamp, bytes) entries within the window
+        self._window_timestamps = array("d", bytes(8 * window_size))
+        self._window_bytes = array("q", bytes(8 * window_size))
+        self._window_start = 0  # Index of the oldest entry
+        self._window_count = 0
+        self._bandwidth_window_sum = 0  # Bytes held in the window
 
     def record_event_processing(
         self, event: NostrEvent, processing_time: float, bytes_processed: int
@@ -290,40 +626,100 @@ class RelayLoadMonitor:
             processing_time: Time taken to process the event in seconds.
             bytes_processed: Number of bytes processed for this event.
         """
-        current_time = time.time()
+        current_time = time.perf_counter()
+        stats = self.stats
 
-        self.stats.total_cpu_time += processing_time
-        self.stats.total_bandwidth_bytes += bytes_processed
-        self.stats.event_processing_times.append(processing_time)
-
-        self.recent_processing_times.append((current_time, processing_time))
-        self.recent_bandwidth_usage.append((current_time, bytes_processed))
+        stats.total_cpu_time += processing_time
+        stats.total_bandwidth_bytes += bytes_processed
+        stats.event_count += 1
 
         # Update peak values
-        if processing_time > self.stats.peak_cpu_usage:
-            self.stats.peak_cpu_usage = processing_time
+        if processing_time > stats.peak_cpu_usage:
+            stats.peak_cpu_usage = processing_time
+
+        # Only check for stale entries when the oldest one has aged out
+        if (
+            self._window_count
+            and self._window_timestamps[self._window_start] < current_time - 1.0
+        ):
+            self._evict_stale_entries(current_time)
+        self._append_window_entry(current_time, bytes_processed)
 
         # Calculate current bandwidth rate (bytes per second over last second)
-        current_bandwidth_rate = self._calculate_bandwidth_rate()
+        current_bandwidth_rate = float(self._bandwidth_window_sum)
+        if current_bandwidth_rate > stats.peak_bandwidth_rate:
+            stats.peak_bandwidth_rate = current_bandwidth_rate
+
+    def record_events_bulk(
+        self, processing_times: npt.ArrayLike, bytes_processed: npt.ArrayLike
+    ) -> None:
+        """Record processing time and bandwidth for a batch of events.
+
+        All events in the batch share one timestamp, and the peak bandwidth
+        rate is sampled once after the whole batch is in the window.
+
+        Args:
+            processing_times: Time taken to process each event in seconds.
+            bytes_processed: Number of bytes processed for each event.
+        """
+        times = np.asarray(processing_times, dtype=np.float64).ravel()
+        sizes = np.asarray(bytes_processed, dtype=np.int64).ravel()
+        if times.size != sizes.size:
+            raise ValueError("processing_times and bytes_processed differ in length")
+        if not times.size:
+            return
+        current_time = time.perf_counter()
+
+        self.stats.total_cpu_time += float(times.sum())
+        self.stats.total_bandwidth_bytes += int(sizes.sum())
+        self.stats.event_count += times.size
+        self.stats.peak_cpu_usage = max(self.stats.peak_cpu_usage, float(times.max()))
+
+        # Only the newest window_size events can still be in the window
+        self._evict_stale_entries(current_time)
+        for size in sizes[-self.window_size :].tolist():
+            self._append_window_entry(current_time, size)
+
+        current_bandwidth_rate = float(self._bandwidth_window_sum)
         if current_bandwidth_rate > self.stats.peak_bandwidth_rate:
             self.stats.peak_bandwidth_rate = current_bandwidth_rate
 
-    def _calculate_bandwidth_rate(self) -> float:
-        """Calculate current bandwidth rate in bytes per second."""
-        if not self.recent_bandwidth_usage:
-            return 0.0
+    def _append_window_entry(self, timestamp: float, bytes_processed: int) -> None:
+        """Add an entry to the window, evicting the oldest one if it is full.
 
-        current_time = time.time()
-        one_second_ago = current_time - 1.0
+        Args:
+            timestamp: Time the event was recorded.
+            bytes_processed: Number of bytes processed for the event.
+        """
+        if self._window_count == self.window_size:
+            self._evict_oldest()
+        end = (self._window_start + self._window_count) % self.window_size
+        self._window_timestamps[end] = timestamp
+        self._window_bytes[end] = bytes_processed
+        self._window_count += 1
+        self._bandwidth_window_sum += bytes_processed
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest window entry and remove its bytes from the sum."""
+        self._bandwidth_window_sum -= self._window_bytes[self._window_start]
+        self._window_start = (self._window_start + 1) % self.window_size
+        self._window_count -= 1
+
+    def _evict_stale_entries(self, current_time: float) -> None:
+        """Drop window entries older than one second.
 
-        # Sum bytes processed in the last second
-        bytes_last_second = sum(
-            bytes_count
-            for timestamp, bytes_count in self.recent_bandwidth_usage
-            if timestamp >= one_second_ago
-        )
+        Args:
+            current_time: Timestamp the one-second window ends at.
+        """
+        one_second_ago = current_time - 1.0
+        timestamps = self._window_timestamps
+        while self._window_count and timestamps[self._window_start] < one_second_ago:
+            self._evict_oldest()
 
-        return float(bytes_last_second)
+    def _calculate_bandwidth_rate(self) -> float:
+        """Calculate current bandwidth rate in bytes per second."""
+        self._evict_stale_entries(time.perf_counter())
+        return float(self._bandwidth_window_sum)
 
     def get_stats(self) -> RelayLoadStats:
         """Get current relay load statistics.
@@ -339,20 +735,8 @@ class RelayLoadMonitor:
         Returns:
             Current CPU load in events per second.
         """
-        if not self.recent_processing_times:
-            return 0.0
-
-        current_time = time.time()
-        one_second_ago = current_time - 1.0
-
-        # Count events processed in the last second
-        events_last_second = sum(
-            1
-            for timestamp, _ in self.recent_processing_times
-            if timestamp >= one_second_ago
-        )
-
-        return float(events_last_second)
+        self._evict_stale_entries(time.perf_counter())
+        return float(self._window_count)
 
     def get_current_bandwidth_rate(self) -> float:
         """Get current bandwidth rate in bytes per second.
@@ -366,11 +750,15 @@ class RelayLoadMonitor:
 class LatencyMeasurement:
     """Measures latency for various operations."""
 
+    __slots__ = ("stats", "active_measurements", "_strategy_stats_cache")
+
     def __init__(self) -> None:
         """Initialize the latency measurement system."""
-        self.logger = get_logger(__name__)
         self.stats = LatencyStats()
-        self.active_measurements: dict[str, float] = {}  # operation_id -> start_time
+        # operation_id -> start time in integer nanoseconds
+        self.active_measurements: dict[str, int] = {}
+        # strategy -> (sample count when computed, stats)
+        self._strategy_stats_cache: dict[str, tuple[int, dict[str, float]]] = {}
 
     def start_measurement(self, operation_id: str) -> None:
         """Start measuring latency for an operation.
@@ -378,7 +766,7 @@ class LatencyMeasurement:
         Args:
             operation_id: Unique identifier for the operation.
         """
-        self.active_measurements[operation_id] = time.perf_counter()
+        self.active_measurements[operation_id] = time.perf_counter_ns()
 
     def end_measurement(
         self, operation_id: str, measurement_type: str = "processing"
@@ -392,22 +780,22 @@ class LatencyMeasurement:
         Returns:
             The measured latency in seconds.
         """
-        if operation_id not in self.active_measurements:
-            self.logger.warning(
-                f"No active measurement found for operation {operation_id}"
-            )
+        end_time = time.perf_counter_ns()
+        start_time = self.active_measurements.pop(operation_id, None)
+        if start_time is None:
+            logger.warning(f"No active measurement found for operation {operation_id}")
             return 0.0
 
-        start_time = self.active_measurements.pop(operation_id)
-        latency = time.perf_counter() - start_time
+        # Subtract exact integer nanoseconds, then convert once to seconds
+        latency = (end_time - start_time) / 1e9
 
         if measurement_type == "processing":
-            self.stats.processing_latencies.append(latency)
+            self.stats.processing_latencies.add(latency)
         elif measurement_type == "validation":
-            self.stats.validation_latencies.append(latency)
+            self.stats.validation_latencies.add(latency)
         else:
             # Assume it's a strategy name
-            self.stats.strategy_latencies[measurement_type].append(latency)
+            self.stats.strategy_latencies[measurement_type].add(latency)
 
         return latency
 
@@ -421,12 +809,31 @@ class LatencyMeasurement:
             measurement_type: Type of measurement ("processing", "validation", or strategy name).
         """
         if measurement_type == "processing":
-            self.stats.processing_latencies.append(latency)
+            self.stats.processing_latencies.add(latency)
         elif measurement_type == "validation":
-            self.stats.validation_latencies.append(latency)
+            self.stats.validation_latencies.add(latency)
         else:
             # Assume it's a strategy name
-            self.stats.strategy_latencies[measurement_type].append(latency)
+            self.stats.strategy_latencies[measurement_type].add(latency)
+
+    def record_latencies_bulk(
+        self, latencies: npt.ArrayLike, measurement_type: str = "processing"
+    ) -> None:
+        """Record a batch of latency measurements at once.
+
+        Args:
+            latencies: Latency values in seconds.
+            measurement_type: Type of measurement ("processing", "validation", or
+                strategy name).
+        """
+        if measurement_type == "processing":
+            sketch = self.stats.processing_latencies
+        elif measurement_type == "validation":
+            sketch = self.stats.validation_latencies
+        else:
+            # Assume it's a strategy name
+            sketch = self.stats.strategy_latencies[measurement_type]
+        sketch.add_many(latencies)
 
     def get_stats(self) -> LatencyStats:
         """Get current latency statistics.
@@ -439,58 +846,53 @@ class LatencyMeasurement:
     def get_strategy_stats(self, strategy_name: str) -> dict[str, float]:
         """Get latency statistics for a specific strategy.
 
+        Results are cached until the strategy records another sample.
+
         Args:
             strategy_name: Name of the strategy.
 
         Returns:
             Dictionary with average, p95, and p99 latencies for the strategy.
         """
-        latencies = self.stats.strategy_latencies.get(strategy_name, [])
-        if not latencies:
+        sketch = self.stats.strategy_latencies.get(strategy_name)
+        if sketch is None or not sketch.count:
             return {"average": 0.0, "p95": 0.0, "p99": 0.0}
 
-        sorted_latencies = sorted(latencies)
-        return {
-            "average": sum(latencies) / len(latencies),
-            "p95": (
-                sorted_latencies[
-                    min(
-                        int(0.95 * (len(sorted_latencies) - 1)),
-                        len(sorted_latencies) - 1,
-                    )
-                ]
-                if len(sorted_latencies) > 0
-                else 0.0
-            ),
-            "p99": (
-                sorted_latencies[
-                    min(
-                        int(0.99 * (len(sorted_latencies) - 1)),
-                        len(sorted_latencies) - 1,
-                    )
-                ]
-                if len(sorted_latencies) > 0
-                else 0.0
-            ),
-        }
+        cached = self._strategy_stats_cache.get(strategy_name)
+        if cached is None or cached[0] != sketch.count:
+            p95, p99 = sketch.quantiles((0.95, 0.99))
+            cached = (sketch.count, {"average": sketch.mean, "p95": p95, "p99": p99})
+            self._strategy_stats_cache[strategy_name] = cached
+        return dict(cached[1])
 
 
 class SpamReductionCalculator:
     """Calculates spam reduction effectiveness."""
 
-    def __init__(self) -> None:
-        """Initialize the spam reduction calculator."""
-        self.logger = get_logger(__name__)
+    __slots__ = (
+        "stats_by_strategy",
+        "overall_stats",
+        "ground_truth",
+        "event_labels",
+        "strategy_decisions",
+    )
+
+    def __init__(self, ground_truth: GroundTruthStore | None = None) -> None:
+        """Initialize the spam reduction calculator.
+
+        Args:
+            ground_truth: Store of labels and decisions to share with other
+                trackers, or None to use a private store.
+        """
         self.stats_by_strategy: dict[str, SpamReductionStats] = defaultdict(
             SpamReductionStats
         )
         self.overall_stats = SpamReductionStats()
 
         # Event tracking
-        self.event_labels: dict[str, bool] = {}  # event_id -> is_spam
-        self.strategy_decisions: dict[str, dict[str, bool]] = defaultdict(
-            dict
-        )  # strategy -> event_id -> blocked
+        self.ground_truth = ground_truth or GroundTruthStore()
+        self.event_labels = self.ground_truth.event_labels
+        self.strategy_decisions = self.ground_truth.strategy_decisions
 
     def label_event(self, event: NostrEvent, is_spam: bool) -> None:
         """Label an event as spam or legitimate.
@@ -516,26 +918,47 @@ class SpamReductionCalculator:
             event: The event that was evaluated.
             blocked: True if the event was blocked, False if allowed.
         """
-        self.strategy_decisions[strategy_name][event.id] = blocked
+        event_id = event.id
+        self.ground_truth.record_decision(strategy_name, event_id, blocked)
 
         # Update stats if we have ground truth
-        if event.id in self.event_labels:
-            is_spam = self.event_labels[event.id]
-            stats = self.stats_by_strategy[strategy_name]
-
-            if is_spam:
-                if blocked:
-                    stats.blocked_spam_events += 1
-                    self.overall_stats.blocked_spam_events += 1
-                else:
-                    stats.allowed_spam_events += 1
-                    self.overall_stats.allowed_spam_events += 1
-                stats.total_spam_events += 1
+        is_spam = self.event_labels.get(event_id)
+        if is_spam is not None:
+            self._count_outcome(self.stats_by_strategy[strategy_name], is_spam, blocked)
+
+    def record_outcome(self, strategy_name: str, is_spam: bool, blocked: bool) -> None:
+        """Count a decision on an event whose ground truth is known.
+
+        Args:
+            strategy_name: Name of the strategy.
+            is_spam: True if the event is spam, False if legitimate.
+            blocked: True if the event was blocked, False if allowed.
+        """
+        self._count_outcome(self.stats_by_strategy[strategy_name], is_spam, blocked)
+
+    def _count_outcome(
+        self, stats: SpamReductionStats, is_spam: bool, blocked: bool
+    ) -> None:
+        """Increment the matching counters in a strategy's and the overall stats.
+
+        Args:
+            stats: The strategy's stats.
+            is_spam: True if the event is spam, False if legitimate.
+            blocked: True if the event was blocked, False if allowed.
+        """
+        if is_spam:
+            if blocked:
+                stats.blocked_spam_events += 1
+                self.overall_stats.blocked_spam_events += 1
             else:
-                if blocked:
-                    stats.blocked_legitimate_events += 1
-                    self.overall_stats.blocked_legitimate_events += 1
-                stats.total_legitimate_events += 1
+                stats.allowed_spam_events += 1
+                self.overall_stats.allowed_spam_events += 1
+            stats.total_spam_events += 1
+        else:
+            if blocked:
+                stats.blocked_legitimate_events += 1
+                self.overall_stats.blocked_legitimate_events += 1
+            stats.total_legitimate_events += 1
 
     def get_stats(self, strategy_name: str | None = None) -> SpamReductionStats:
         """Get spam reduction statistics.
@@ -560,22 +983,96 @@ class SpamReductionCalculator:
         result["overall"] = self.overall_stats
         return result
 
+    def all_reduction_percentages(self) -> dict[str, float]:
+        """Get every strategy's spam reduction percentage in one array pass.
+
+        Returns:
+            Dictionary mapping strategy names, plus ``"overall"``, to the
+            percentage of spam blocked.
+        """
+        names, (blocked, total) = self._counter_columns(
+            "blocked_spam_events", "total_spam_events"
+        )
+        return self._percentages(names, blocked, total)
+
+    def all_legitimate_pass_rates(self) -> dict[str, float]:
+        """Get every strategy's legitimate pass rate in one array pass.
+
+        Returns:
+            Dictionary mapping strategy names, plus ``"overall"``, to the
+            percentage of legitimate events allowed.
+        """
+        names, (blocked, total) = self._counter_columns(
+            "blocked_legitimate_events", "total_legitimate_events"
+        )
+        return self._percentages(names, total - blocked, total)
+
+    def _counter_columns(
+        self, *counters: str
+    ) -> tuple[list[str], list[npt.NDArray[np.float64]]]:
+        """Gather counters of every strategy into one array per counter.
+
+        Args:
+            counters: Names of the SpamReductionStats counters to gather.
+
+        Returns:
+            Tuple of the row names, with ``"overall"`` last, and one array
+            per requested counter.
+        """
+        all_stats = self.get_all_stats()
+        columns = [
+            np.array([getattr(s, c) for s in all_stats.values()], dtype=np.float64)
+            for c in counters
+        ]
+        return list(all_stats), columns
+
+    @staticmethod
+    def _percentages(
+        names: list[str],
+        parts: npt.NDArray[np.float64],
+        totals: npt.NDArray[np.float64],
+    ) -> dict[str, float]:
+        """Divide two counter columns into percentages.
+
+        Args:
+            names: Row names.
+            parts: Numerator counts.
+            totals: Denominator counts.
+
+        Returns:
+            Dictionary mapping names to ``100 * part / total``, or 0.0 where
+            the total is zero.
+        """
+        percentages = np.divide(
+            100.0 * parts, totals, out=np.zeros_like(parts), where=totals > 0
+        )
+        return dict(zip(names, percentages.tolist(), strict=True))
+
 
 class ResilienceMetrics:
     """Measures system resilience against various attack vectors."""
 
+    __slots__ = (
+        "stats",
+        "_attack_timestamps",
+        "_attack_types",
+        "_attack_detected",
+        "_attack_timestamps_sorted",
+        "recovery_start_times",
+    )
+
     def __init__(self) -> None:
         """Initialize the resilience metrics system."""
-        self.logger = get_logger(__name__)
         self.stats = ResilienceStats()
 
-        # Attack tracking
-        self.attack_events: list[tuple[float, str, bool]] = (
-            []
-        )  # (timestamp, attack_type, detected)
-        self.recovery_start_times: dict[str, float] = (
+        # Attack tracking, one parallel column per attack field
+        self._attack_timestamps = array("d")
+        self._attack_types: list[str] = []
+        self._attack_detected = bytearray()
+        self._attack_timestamps_sorted = True  # Enables bisect window lookups
+        self.recovery_start_times: dict[str, int] = (
             {}
-        )  # attack_type -> recovery_start_time
+        )  # attack_type -> recovery start time in nanoseconds
 
     def record_attack(
         self, attack_type: str, detected: bool, timestamp: float | None = None
@@ -590,9 +1087,14 @@ class ResilienceMetrics:
         if timestamp is None:
             timestamp = time.time()
 
-        self.attack_events.append((timestamp, attack_type, detected))
+        timestamps = self._attack_timestamps
+        if timestamps and timestamp < timestamps[-1]:
+            self._attack_timestamps_sorted = False
+        timestamps.append(timestamp)
+        self._attack_types.append(sys.intern(attack_type))
+        self._attack_detected.append(detected)
 
-        if attack_type in ["offline_sybil", "offline_spam", "offline_replay"]:
+        if attack_type in _OFFLINE_ATTACK_TYPES:
             if detected:
                 self.stats.offline_attacks_detected += 1
             else:
@@ -604,7 +1106,7 @@ class ResilienceMetrics:
         Args:
             attack_type: Type of attack being recovered from.
         """
-        self.recovery_start_times[attack_type] = time.time()
+        self.recovery_start_times[attack_type] = time.monotonic_ns()
 
     def end_recovery(self, attack_type: str) -> None:
         """Mark the end of recovery from an attack.
@@ -613,8 +1115,10 @@ class ResilienceMetrics:
             attack_type: Type of attack that was recovered from.
         """
         if attack_type in self.recovery_start_times:
-            recovery_time = time.time() - self.recovery_start_times.pop(attack_type)
-            self.stats.recovery_time_seconds += recovery_time
+            recovery_ns = time.monotonic_ns() - self.recovery_start_times.pop(
+                attack_type
+            )
+            self.stats.recovery_time_seconds += recovery_ns / 1e9
 
     def update_sybil_resistance_score(self, score: float) -> None:
         """Update the sybil resistance score.
@@ -642,37 +1146,83 @@ class ResilienceMetrics:
         Returns:
             List of (timestamp, attack_type, detected) tuples.
         """
-        return self.attack_events.copy()
+        return list(
+            zip(
+                self._attack_timestamps,
+                self._attack_types,
+                map(bool, self._attack_detected),
+                strict=True,
+            )
+        )
+
+    def detection_rate_in_window(self, start: float, end: float) -> float:
+        """Calculate the attack detection rate within a time window.
+
+        Args:
+            start: Inclusive start timestamp of the window.
+            end: Inclusive end timestamp of the window.
+
+        Returns:
+            Percentage of attacks in the window that were detected.
+        """
+        timestamps = self._attack_timestamps
+        if self._attack_timestamps_sorted:
+            lo = bisect.bisect_left(timestamps, start)
+            hi = bisect.bisect_right(timestamps, end)
+            total = hi - lo
+            detected = self._attack_detected.count(1, lo, hi)
+        else:
+            # Copies rather than views, so the columns stay appendable
+            ts = np.array(timestamps)
+            in_window = (ts >= start) & (ts <= end)
+            total = int(np.count_nonzero(in_window))
+            flags = np.array(self._attack_detected, dtype=np.bool_)
+            detected = int(np.count_nonzero(flags & in_window))
+        return detected / total * 100 if total > 0 else 0.0
 
 
 class CoreMetricsCollector:
     """Central collector for all core metrics."""
 
+    __slots__ = (
+        "ground_truth",
+        "fp_fn_tracker",
+        "relay_load_monitor",
+        "latency_measurement",
+        "spam_reduction_calculator",
+        "resilience_metrics",
+        "collection_start_time",
+        "_collection_start_monotonic",
+        "is_collecting",
+    )
+
     def __init__(self) -> None:
         """Initialize the core metrics collector."""
-        self.logger = get_logger(__name__)
-
-        # Individual metric systems
-        self.fp_fn_tracker = FalsePositiveNegativeTracker()
+        # Individual metric systems; both classifiers share one ground truth
+        self.ground_truth = GroundTruthStore()
+        self.fp_fn_tracker = FalsePositiveNegativeTracker(self.ground_truth)
         self.relay_load_monitor = RelayLoadMonitor()
         self.latency_measurement = LatencyMeasurement()
-        self.spam_reduction_calculator = SpamReductionCalculator()
+        self.spam_reduction_calculator = SpamReductionCalculator(self.ground_truth)
         self.resilience_metrics = ResilienceMetrics()
 
-        # Collection state
+        # Collection state; the wall-clock start is reported, the monotonic
+        # start is used to measure the collection duration
         self.collection_start_time = time.time()
+        self._collection_start_monotonic = time.monotonic()
         self.is_collecting = False
 
     def start_collection(self) -> None:
         """Start metrics collection."""
         self.is_collecting = True
         self.collection_start_time = time.time()
-        self.logger.info("Started core metrics collection")
+        self._collection_start_monotonic = time.monotonic()
+        logger.info("Started core metrics collection")
 
     def stop_collection(self) -> None:
         """Stop metrics collection."""
         self.is_collecting = False
-        self.logger.info("Stopped core metrics collection")
+        logger.info("Stopped core metrics collection")
 
     def label_event(self, event: NostrEvent, is_spam: bool) -> None:
         """Label an event for ground truth tracking.
@@ -682,7 +1232,7 @@ class CoreMetricsCollector:
             is_spam: True if spam, False if legitimate.
         """
         if self.is_collecting:
-            self.fp_fn_tracker.label_event(event, is_spam)
+            # The label lands in the shared store, which fp_fn_tracker reads
             self.spam_reduction_calculator.label_event(event, is_spam)
 
     def record_strategy_evaluation(
@@ -696,15 +1246,23 @@ class CoreMetricsCollector:
             result: The strategy's evaluation result.
         """
         if self.is_collecting:
-            self.fp_fn_tracker.record_strategy_decision(strategy_name, event, result)
-            self.spam_reduction_calculator.record_strategy_decision(
-                strategy_name, event, not result.allowed
-            )
+            ground_truth = self.ground_truth
+            event_id = event.id
+            blocked = not result.allowed
+            ground_truth.record_decision(strategy_name, event_id, blocked)
+
+            is_spam = ground_truth.event_labels.get(event_id)
+            if is_spam is not None:
+                self.fp_fn_tracker.record_outcome(strategy_name, is_spam, blocked)
+                self.spam_reduction_calculator.record_outcome(
+                    strategy_name, is_spam, blocked
+                )
 
             # Record latency if provided in metrics
-            if result.metrics and "latency" in result.metrics:
+            metrics = result.metrics
+            if metrics and "latency" in metrics:
                 self.latency_measurement.record_latency(
-                    result.metrics["latency"], strategy_name
+                    metrics["latency"], strategy_name
                 )
 
     def record_event_processing(
@@ -738,7 +1296,8 @@ class CoreMetricsCollector:
         Returns:
             Dictionary containing all metrics and statistics.
         """
-        collection_duration = time.time() - self.collection_start_time
+        collection_duration = time.monotonic() - self._collection_start_monotonic
+        calculator = self.spam_reduction_calculator
 
         return {
             "collection_info": {
@@ -749,18 +1308,21 @@ class CoreMetricsCollector:
             "false_positive_negative": {
                 "overall": self.fp_fn_tracker.get_stats(),
                 "by_strategy": self.fp_fn_tracker.get_all_stats(),
+                "rates": self.fp_fn_tracker.all_rates(),
             },
             "relay_load": self.relay_load_monitor.get_stats(),
             "latency": {
                 "overall": self.latency_measurement.get_stats(),
                 "by_strategy": {
                     strategy: self.latency_measurement.get_strategy_stats(strategy)
-                    for strategy in self.latency_measurement.stats.strategy_latencies.keys()
+                    for strategy in self.latency_measurement.stats.strategy_latencies
                 },
             },
             "spam_reduction": {
                 "overall": self.spam_reduction_calculator.get_stats(),
                 "by_strategy": self.spam_reduction_calculator.get_all_stats(),
+                "reduction_percentages": calculator.all_reduction_percentages(),
+                "legitimate_pass_rates": calculator.all_legitimate_pass_rates(),
             },
             "resilience": {
                 "stats": self.resilience_metrics.get_stats(),
@@ -1,20 +1,40 @@
 """Tests for the core metrics system."""
 
+import math
 import time
+from unittest.mock import patch
+
+import numpy as np
+import pytest
 
 from ..anti_spam.base import StrategyResult
 from ..protocol.events import NostrEvent, NostrEventKind
 from ..protocol.keys import NostrKeyPair
+from . import core_metrics
 from .core_metrics import (
     CoreMetricsCollector,
     FalsePositiveNegativeStats,
     FalsePositiveNegativeTracker,
     LatencyMeasurement,
+    LatencySketch,
     RelayLoadMonitor,
     ResilienceMetrics,
     SpamReductionCalculator,
 )
 
+# Tests only use the public key, so one generated key authors every test event.
+_PUBKEY = NostrKeyPair.generate().public_key
+
+
+def _make_test_event(content: str = "test") -> NostrEvent:
+    """Create a text note; events with distinct content get distinct ids."""
+    return NostrEvent(
+        kind=NostrEventKind.TEXT_NOTE,
+        content=content,
+        created_at=1_700_000_000,
+        pubkey=_PUBKEY,
+    )
+
 
 class TestFalsePositiveNegativeStats:
     """Test the FalsePositiveNegativeStats class."""
@@ -54,6 +74,11 @@ class TestFalsePositiveNegativeStats:
         stats = FalsePositiveNegativeStats()
         assert stats.f1_score == 0.0
 
+    def test_f1_score_without_true_positives(self) -> None:
+        """Test F1 score when only errors were recorded."""
+        stats = FalsePositiveNegativeStats(false_positives=3, false_negatives=2)
+        assert stats.f1_score == 0.0
+
     def test_accuracy_calculation(self) -> None:
         """Test accuracy calculation."""
         stats = FalsePositiveNegativeStats(
@@ -66,6 +91,13 @@ class TestFalsePositiveNegativeStats:
         stats = FalsePositiveNegativeStats()
         assert stats.accuracy == 0.0
 
+    def test_stats_use_slots(self) -> None:
+        """Test that stats instances carry no per-instance __dict__."""
+        stats = FalsePositiveNegativeStats()
+        assert not hasattr(stats, "__dict__")
+        with pytest.raises(AttributeError):
+            stats.true_positive = 1  # type: ignore[attr-defined]
+
 
 class TestFalsePositiveNegativeTracker:
     """Test the FalsePositiveNegativeTracker class."""
@@ -73,26 +105,23 @@ class TestFalsePositiveNegativeTracker:
     def setup_method(self) -> None:
         """Set up test fixtures."""
         self.tracker = FalsePositiveNegativeTracker()
-        self.keypair = NostrKeyPair.generate()
-
-    def create_test_event(self, content: str = "test") -> NostrEvent:
-        """Create a test event."""
-        return NostrEvent(
-            kind=NostrEventKind.TEXT_NOTE,
-            content=content,
-            created_at=int(time.time()),
-            pubkey=self.keypair.public_key,
-        )
 
     def test_label_event(self) -> None:
         """Test event labeling."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.tracker.label_event(event, True)
         assert self.tracker.event_labels[event.id] is True
 
+    def test_label_event_keys_by_event_id_string(self) -> None:
+        """Test that labels reuse the event's id string as the key."""
+        event = _make_test_event()
+        self.tracker.label_event(event, False)
+        (key,) = self.tracker.event_labels
+        assert key is event.id
+
     def test_record_strategy_decision_true_positive(self) -> None:
         """Test recording a true positive decision."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.tracker.label_event(event, True)  # Spam
 
         result = StrategyResult(allowed=False, reason="blocked spam")
@@ -106,7 +135,7 @@ class TestFalsePositiveNegativeTracker:
 
     def test_record_strategy_decision_false_positive(self) -> None:
         """Test recording a false positive decision."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.tracker.label_event(event, False)  # Legitimate
 
         result = StrategyResult(allowed=False, reason="blocked legitimate")
@@ -120,7 +149,7 @@ class TestFalsePositiveNegativeTracker:
 
     def test_record_strategy_decision_true_negative(self) -> None:
         """Test recording a true negative decision."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.tracker.label_event(event, False)  # Legitimate
 
         result = StrategyResult(allowed=True, reason="allowed legitimate")
@@ -134,7 +163,7 @@ class TestFalsePositiveNegativeTracker:
 
     def test_record_strategy_decision_false_negative(self) -> None:
         """Test recording a false negative decision."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.tracker.label_event(event, True)  # Spam
 
         result = StrategyResult(allowed=True, reason="allowed spam")
@@ -148,8 +177,8 @@ class TestFalsePositiveNegativeTracker:
 
     def test_overall_stats(self) -> None:
         """Test overall statistics tracking."""
-        event1 = self.create_test_event("spam1")
-        event2 = self.create_test_event("legitimate1")
+        event1 = _make_test_event("spam1")
+        event2 = _make_test_event("legitimate1")
 
         self.tracker.label_event(event1, True)  # Spam
         self.tracker.label_event(event2, False)  # Legitimate
@@ -166,9 +195,27 @@ class TestFalsePositiveNegativeTracker:
         assert overall_stats.false_positives == 0
         assert overall_stats.false_negatives == 0
 
+    def test_strategy_decisions_track_blocked_ids(self) -> None:
+        """Test that decisions keep only the ids of blocked events."""
+        blocked_event = _make_test_event("blocked")
+        allowed_event = _make_test_event("allowed")
+
+        self.tracker.record_strategy_decision(
+            "strategy1", blocked_event, StrategyResult(allowed=False, reason="no")
+        )
+        self.tracker.record_strategy_decision(
+            "strategy1", allowed_event, StrategyResult(allowed=True, reason="ok")
+        )
+        assert self.tracker.strategy_decisions["strategy1"] == {blocked_event.id}
+
+        self.tracker.record_strategy_decision(
+            "strategy1", blocked_event, StrategyResult(allowed=True, reason="ok")
+        )
+        assert self.tracker.strategy_decisions["strategy1"] == set()
+
     def test_get_all_stats(self) -> None:
         """Test getting all strategy stats."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.tracker.label_event(event, True)
 
         result = StrategyResult(allowed=False, reason="blocked")
@@ -181,6 +228,71 @@ class TestFalsePositiveNegativeTracker:
         assert "overall" in all_stats
         assert all_stats["overall"].true_positives == 2  # Both strategies recorded
 
+    def test_record_outcomes_bulk_matches_per_event(self) -> None:
+        """Test that a bulk batch counts the same as per-event outcomes."""
+        is_spam = [True, True, False, False, True, False, True]
+        blocked = [True, False, True, False, True, False, False]
+
+        self.tracker.record_outcomes_bulk("bulk", is_spam, blocked)
+        reference = FalsePositiveNegativeTracker()
+        for label, decision in zip(is_spam, blocked, strict=True):
+            reference.record_outcome("bulk", label, decision)
+
+        assert self.tracker.get_stats("bulk") == reference.get_stats("bulk")
+        assert self.tracker.get_stats() == reference.get_stats()
+
+    def test_confusion_matrix(self) -> None:
+        """Test that the matrix rows mirror the per-strategy stats."""
+        self.tracker.record_outcomes_bulk("a", [True, True, False], [True, False, True])
+        self.tracker.record_outcomes_bulk("b", [False], [False])
+
+        names, matrix = self.tracker.confusion_matrix()
+
+        assert names == ["a", "b", "overall"]
+        assert matrix.dtype == np.int64
+        assert matrix.tolist() == [[1, 0, 1, 1], [0, 1, 0, 0], [1, 1, 1, 1]]
+
+    def test_all_rates_match_stats_properties(self) -> None:
+        """Test that the vectorized rates agree with each stats object."""
+        self.tracker.record_outcomes_bulk(
+            "a", [True] * 10 + [False] * 15, [True] * 8 + [False] * 14 + [True] * 3
+        )
+        self.tracker.get_stats("empty")
+
+        rates = self.tracker.all_rates()
+
+        for name, stats in self.tracker.get_all_stats().items():
+            assert rates[name] == pytest.approx(
+                {
+                    "precision": stats.precision,
+                    "recall": stats.recall,
+                    "f1_score": stats.f1_score,
+                    "accuracy": stats.accuracy,
+                }
+            )
+        assert rates["empty"]["f1_score"] == 0.0
+
+    def test_confusion_matrix_reflects_reset_stats(self) -> None:
+        """Test that the matrix follows stats changed in place."""
+        self.tracker.record_outcome("a", True, True)
+        assert self.tracker.confusion_matrix()[1].tolist() == [
+            [1, 0, 0, 0],
+            [1, 0, 0, 0],
+        ]
+
+        self.tracker.overall_stats.true_positives = 0
+        self.tracker.stats_by_strategy["a"].false_negatives = 1
+
+        assert self.tracker.confusion_matrix()[1].tolist() == [
+            [1, 0, 0, 1],
+            [0, 0, 0, 0],
+        ]
+
+    def test_record_outcomes_bulk_rejects_mismatched_lengths(self) -> None:
+        """Test that bulk outcomes need one decision per label."""
+        with pytest.raises(ValueError, match="differ in length"):
+            self.tracker.record_outcomes_bulk("bulk", [True, False], [True])
+
 
 class TestRelayLoadMonitor:
     """Test the RelayLoadMonitor class."""
@@ -188,32 +300,21 @@ class TestRelayLoadMonitor:
     def setup_method(self) -> None:
         """Set up test fixtures."""
         self.monitor = RelayLoadMonitor(window_size=10)
-        self.keypair = NostrKeyPair.generate()
-
-    def create_test_event(self) -> NostrEvent:
-        """Create a test event."""
-        return NostrEvent(
-            kind=NostrEventKind.TEXT_NOTE,
-            content="test event",
-            created_at=int(time.time()),
-            pubkey=self.keypair.public_key,
-        )
 
     def test_record_event_processing(self) -> None:
         """Test recording event processing metrics."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.monitor.record_event_processing(event, 0.1, 1024)
 
         stats = self.monitor.get_stats()
         assert stats.total_cpu_time == 0.1
         assert stats.total_bandwidth_bytes == 1024
-        assert len(stats.event_processing_times) == 1
-        assert stats.event_processing_times[0] == 0.1
+        assert stats.event_count == 1
 
     def test_peak_values_tracking(self) -> None:
         """Test tracking of peak values."""
-        event1 = self.create_test_event()
-        event2 = self.create_test_event()
+        event1 = _make_test_event()
+        event2 = _make_test_event()
 
         self.monitor.record_event_processing(event1, 0.1, 1024)
         self.monitor.record_event_processing(event2, 0.2, 2048)  # Higher values
@@ -225,8 +326,8 @@ class TestRelayLoadMonitor:
 
     def test_average_calculations(self) -> None:
         """Test average calculation properties."""
-        event1 = self.create_test_event()
-        event2 = self.create_test_event()
+        event1 = _make_test_event()
+        event2 = _make_test_event()
 
         self.monitor.record_event_processing(event1, 0.1, 1000)
         self.monitor.record_event_processing(event2, 0.3, 2000)
@@ -237,7 +338,7 @@ class TestRelayLoadMonitor:
 
     def test_current_load_calculation(self) -> None:
         """Test current load calculation."""
-        event = self.create_test_event()
+        event = _make_test_event()
 
         # Record multiple events quickly
         for _ in range(3):
@@ -250,6 +351,50 @@ class TestRelayLoadMonitor:
         assert cpu_load >= 0
         assert bandwidth_rate >= 0
 
+    def test_window_evicts_entries_older_than_one_second(self) -> None:
+        """Test that the running window drops entries older than a second."""
+        event = _make_test_event()
+        clock = iter([100.0, 100.5, 101.2, 101.2, 101.2])
+
+        with patch.object(
+            core_metrics.time, "perf_counter", side_effect=lambda: next(clock)
+        ):
+            self.monitor.record_event_processing(event, 0.1, 1000)
+            self.monitor.record_event_processing(event, 0.1, 500)
+            self.monitor.record_event_processing(event, 0.1, 250)
+
+            assert self.monitor.get_current_bandwidth_rate() == 750.0
+            assert self.monitor.get_current_cpu_load() == 2.0
+        assert self.monitor.get_stats().peak_bandwidth_rate == 1500.0
+
+    def test_record_events_bulk(self) -> None:
+        """Test recording a batch of events matches the per-event totals."""
+        self.monitor.record_events_bulk(
+            np.array([0.1, 0.3, 0.2]), np.array([1000, 2000, 3000])
+        )
+
+        stats = self.monitor.get_stats()
+        assert stats.event_count == 3
+        assert stats.total_cpu_time == pytest.approx(0.6)
+        assert stats.total_bandwidth_bytes == 6000
+        assert stats.peak_cpu_usage == 0.3
+        assert stats.peak_bandwidth_rate == 6000.0
+        assert self.monitor.get_current_cpu_load() == 3.0
+
+    def test_record_events_bulk_rejects_mismatched_lengths(self) -> None:
+        """Test that batch arrays must have one entry per event."""
+        with pytest.raises(ValueError, match="differ in length"):
+            self.monitor.record_events_bulk([0.1, 0.2], [100])
+
+    def test_window_is_capped_at_window_size(self) -> None:
+        """Test that the window never holds more than window_size entries."""
+        event = _make_test_event()
+        for _ in range(15):
+            self.monitor.record_event_processing(event, 0.1, 100)
+
+        assert self.monitor.get_current_cpu_load() == 10.0
+        assert self.monitor.get_current_bandwidth_rate() == 1000.0
+
 
 class TestLatencyMeasurement:
     """Test the LatencyMeasurement class."""
@@ -266,7 +411,20 @@ class TestLatencyMeasurement:
 
         assert measured_latency > 0
         assert len(self.latency.stats.processing_latencies) == 1
-        assert self.latency.stats.processing_latencies[0] > 0
+        assert self.latency.stats.processing_latencies.sum > 0
+
+    def test_measurement_uses_integer_nanoseconds(self) -> None:
+        """Test that latencies are exact nanosecond differences in seconds."""
+        start_ns = 10**15  # Large enough that float seconds would round
+        clock = iter([start_ns, start_ns + 1_500])
+
+        with patch.object(
+            core_metrics.time, "perf_counter_ns", side_effect=lambda: next(clock)
+        ):
+            self.latency.start_measurement("op")
+            latency = self.latency.end_measurement("op", "validation")
+
+        assert latency == 1.5e-6
 
     def test_end_measurement_without_start(self) -> None:
         """Test ending measurement without starting."""
@@ -277,7 +435,7 @@ class TestLatencyMeasurement:
         """Test directly recording latency."""
         self.latency.record_latency(0.05, "validation")
         assert len(self.latency.stats.validation_latencies) == 1
-        assert self.latency.stats.validation_latencies[0] == 0.05
+        assert self.latency.stats.validation_latencies.mean == 0.05
 
     def test_strategy_latency_recording(self) -> None:
         """Test recording strategy-specific latencies."""
@@ -291,6 +449,21 @@ class TestLatencyMeasurement:
         assert strategy_stats["p95"] > 0
         assert strategy_stats["p99"] > 0
 
+    def test_strategy_stats_cached_until_new_sample(self) -> None:
+        """Test that strategy stats are reused until another sample arrives."""
+        self.latency.record_latency(0.1, "pow_strategy")
+        first = self.latency.get_strategy_stats("pow_strategy")
+        first["average"] = -1.0  # Callers get their own copy
+
+        with patch.object(LatencySketch, "quantiles") as quantiles:
+            again = self.latency.get_strategy_stats("pow_strategy")
+        quantiles.assert_not_called()
+        assert again["average"] == pytest.approx(0.1)
+
+        self.latency.record_latency(0.3, "pow_strategy")
+        updated = self.latency.get_strategy_stats("pow_strategy")
+        assert updated["average"] == pytest.approx(0.2)
+
     def test_percentile_calculations(self) -> None:
         """Test percentile calculations."""
         # Add many latency measurements
@@ -306,6 +479,114 @@ class TestLatencyMeasurement:
         assert abs(stats.p95_processing_latency - 0.95) <= 0.01  # Allow small variance
         assert abs(stats.p99_processing_latency - 0.99) <= 0.01
 
+    def test_sketch_quantiles_within_relative_accuracy(self) -> None:
+        """Test that sketch quantiles stay within the configured error."""
+        sketch = LatencySketch(relative_accuracy=0.01)
+        values = [0.001 * i for i in range(1, 1001)]
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = values[int(q * (len(values) - 1))]
+            assert abs(sketch.quantile(q) - exact) <= 0.01 * exact
+        assert len(sketch.buckets) < len(values)
+
+    def test_sketch_quantiles_match_single_queries(self) -> None:
+        """Test that a multi-quantile query matches individual queries."""
+        sketch = LatencySketch()
+        for i in range(1, 201):
+            sketch.add(0.002 * i)
+
+        qs = (0.99, 0.5, 0.95)
+        assert sketch.quantiles(qs) == [sketch.quantile(q) for q in qs]
+
+    def test_sketch_quantile_reuses_estimate_until_new_sample(self) -> None:
+        """Test that repeated quantile reads skip the bucket walk."""
+        sketch = LatencySketch()
+        for i in range(1, 101):
+            sketch.add(0.01 * i)
+        p95 = sketch.quantile(0.95)
+
+        with patch.object(LatencySketch, "quantiles") as walk:
+            assert sketch.quantile(0.95) == p95
+        walk.assert_not_called()
+
+        sketch.add(100.0)
+        assert sketch.quantile(1.0) == pytest.approx(100.0, rel=0.01)
+
+    def test_sketch_sorted_keys_invalidated_by_new_bucket(self) -> None:
+        """Test that the cached bucket order is rebuilt after a new bucket."""
+        sketch = LatencySketch()
+        sketch.add(0.5)
+        assert sketch.quantile(1.0) == pytest.approx(0.5, rel=0.01)
+
+        sketch.add(0.5)  # Same bucket keeps the cached order
+        assert sketch._sorted_keys is not None
+
+        sketch.add(2.0)  # New bucket breaks the cache
+        assert sketch._sorted_keys is None
+        assert sketch.quantile(1.0) == pytest.approx(2.0, rel=0.01)
+
+    def test_sketch_mean_matches_exact_mean(self) -> None:
+        """Test the running mean over samples spanning several magnitudes."""
+        values = [10.0 ** -(i % 7) * (1 + i / 1000) for i in range(2000)]
+        sketch = LatencySketch()
+        for value in values[:1000]:
+            sketch.add(value)
+        sketch.add_many(np.array(values[1000:]))
+
+        assert sketch.mean == pytest.approx(math.fsum(values) / len(values), rel=1e-12)
+
+    def test_sketch_counts_non_positive_values(self) -> None:
+        """Test that zero latencies are counted without a log bucket."""
+        sketch = LatencySketch()
+        sketch.add(0.0)
+        sketch.add(0.0)
+        sketch.add(0.5)
+
+        assert sketch.zero_count == 2
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) > 0.0
+
+    def test_record_latencies_bulk_matches_single_records(self) -> None:
+        """Test that a bulk record builds the same sketch as single records."""
+        latencies = [0.0, 0.004, 0.02, 0.02, 0.5, 7200.0]
+        for latency in latencies:
+            self.latency.record_latency(latency, "pow_strategy")
+        self.latency.record_latencies_bulk(np.array(latencies), "validation")
+
+        single = self.latency.stats.strategy_latencies["pow_strategy"]
+        bulk = self.latency.stats.validation_latencies
+        assert bulk.buckets == single.buckets
+        assert bulk.zero_count == single.zero_count
+        assert bulk.count == single.count
+        assert bulk.sum == pytest.approx(single.sum)
+
+    def test_sketch_bucket_range_is_bounded(self) -> None:
+        """Test that out-of-range values collapse into the edge buckets."""
+        sketch = LatencySketch(min_value=1e-3, max_value=10.0)
+        sketch.add(1e-9)
+        sketch.add(1e-4)
+        sketch.add(50.0)
+        sketch.add(5000.0)
+
+        assert sketch.zero_count == 2
+        assert len(sketch.buckets) == 1
+        assert sketch.quantile(1.0) == pytest.approx(10.0, rel=0.01)
+
+    def test_sketch_tail_quantiles_reach_zero_bucket(self) -> None:
+        """Test that a top-down tail walk falls through to the zero bucket."""
+        sketch = LatencySketch()
+        for _ in range(9):
+            sketch.add(0.0)
+        sketch.add(1.0)
+
+        assert sketch.quantiles((0.5, 0.9, 1.0)) == [
+            0.0,
+            0.0,
+            pytest.approx(1.0, rel=0.01),
+        ]
+
     def test_empty_strategy_stats(self) -> None:
         """Test getting stats for non-existent strategy."""
         stats = self.latency.get_strategy_stats("nonexistent")
@@ -320,20 +601,10 @@ class TestSpamReductionCalculator:
     def setup_method(self) -> None:
         """Set up test fixtures."""
         self.calculator = SpamReductionCalculator()
-        self.keypair = NostrKeyPair.generate()
-
-    def create_test_event(self, content: str = "test") -> NostrEvent:
-        """Create a test event."""
-        return NostrEvent(
-            kind=NostrEventKind.TEXT_NOTE,
-            content=content,
-            created_at=int(time.time()),
-            pubkey=self.keypair.public_key,
-        )
 
     def test_label_event_spam(self) -> None:
         """Test labeling an event as spam."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.calculator.label_event(event, True)
 
         assert self.calculator.overall_stats.total_spam_events == 1
@@ -341,7 +612,7 @@ class TestSpamReductionCalculator:
 
     def test_label_event_legitimate(self) -> None:
         """Test labeling an event as legitimate."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.calculator.label_event(event, False)
 
         assert self.calculator.overall_stats.total_spam_events == 0
@@ -349,7 +620,7 @@ class TestSpamReductionCalculator:
 
     def test_record_spam_blocked(self) -> None:
         """Test recording blocked spam."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.calculator.label_event(event, True)  # Spam
         self.calculator.record_strategy_decision(
             "test_strategy", event, True
@@ -361,7 +632,7 @@ class TestSpamReductionCalculator:
 
     def test_record_spam_allowed(self) -> None:
         """Test recording allowed spam."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.calculator.label_event(event, True)  # Spam
         self.calculator.record_strategy_decision(
             "test_strategy", event, False
@@ -373,7 +644,7 @@ class TestSpamReductionCalculator:
 
     def test_record_legitimate_blocked(self) -> None:
         """Test recording blocked legitimate event."""
-        event = self.create_test_event()
+        event = _make_test_event()
         self.calculator.label_event(event, False)  # Legitimate
         self.calculator.record_strategy_decision(
             "test_strategy", event, True
@@ -386,7 +657,7 @@ class TestSpamReductionCalculator:
         """Test spam reduction percentage calculation."""
         # Create 10 spam events, block 8 of them
         for i in range(10):
-            event = self.create_test_event(f"spam_{i}")
+            event = _make_test_event(f"spam_{i}")
             self.calculator.label_event(event, True)
             blocked = i < 8  # Block first 8
             self.calculator.record_strategy_decision("test_strategy", event, blocked)
@@ -398,7 +669,7 @@ class TestSpamReductionCalculator:
         """Test legitimate pass rate calculation."""
         # Create 10 legitimate events, block 2 of them
         for i in range(10):
-            event = self.create_test_event(f"legitimate_{i}")
+            event = _make_test_event(f"legitimate_{i}")
             self.calculator.label_event(event, False)
             blocked = i < 2  # Block first 2
             self.calculator.record_strategy_decision("test_strategy", event, blocked)
@@ -408,8 +679,8 @@ class TestSpamReductionCalculator:
 
     def test_overall_stats(self) -> None:
         """Test overall statistics aggregation."""
-        event1 = self.create_test_event("spam1")
-        event2 = self.create_test_event("legitimate1")
+        event1 = _make_test_event("spam1")
+        event2 = _make_test_event("legitimate1")
 
         self.calculator.label_event(event1, True)
         self.calculator.label_event(event2, False)
@@ -427,6 +698,33 @@ class TestSpamReductionCalculator:
         assert overall_stats.blocked_spam_events == 1
         assert overall_stats.blocked_legitimate_events == 0
 
+    def test_all_percentages_match_per_strategy_properties(self) -> None:
+        """Test that the array readouts agree with each stats object."""
+        for strategy, spam_blocked, legit_blocked in (("a", 3, 1), ("b", 0, 0)):
+            for i in range(4):
+                spam = _make_test_event(f"{strategy}_spam_{i}")
+                legit = _make_test_event(f"{strategy}_legit_{i}")
+                self.calculator.label_event(spam, True)
+                self.calculator.label_event(legit, False)
+                self.calculator.record_strategy_decision(
+                    strategy, spam, i < spam_blocked
+                )
+                self.calculator.record_strategy_decision(
+                    strategy, legit, i < legit_blocked
+                )
+        self.calculator.get_stats("empty")
+
+        reductions = self.calculator.all_reduction_percentages()
+        pass_rates = self.calculator.all_legitimate_pass_rates()
+
+        all_stats = self.calculator.get_all_stats()
+        assert list(reductions) == ["a", "b", "empty", "overall"]
+        for name, stats in all_stats.items():
+            assert reductions[name] == pytest.approx(stats.spam_reduction_percentage)
+            assert pass_rates[name] == pytest.approx(stats.legitimate_pass_rate)
+        assert reductions["a"] == 75.0
+        assert pass_rates["empty"] == 0.0
+
 
 class TestResilienceMetrics:
     """Test the ResilienceMetrics class."""
@@ -444,6 +742,27 @@ class TestResilienceMetrics:
         assert timeline[0][1] == "sybil"
         assert timeline[0][2] is True
 
+    def test_detection_rate_in_window(self) -> None:
+        """Test detection rate over a timestamp window."""
+        for ts, detected in [(1.0, True), (2.0, False), (3.0, True), (4.0, True)]:
+            self.metrics.record_attack("sybil", detected, timestamp=ts)
+
+        assert self.metrics.detection_rate_in_window(2.0, 3.0) == 50.0
+        assert self.metrics.detection_rate_in_window(1.0, 4.0) == 75.0
+        assert self.metrics.detection_rate_in_window(5.0, 6.0) == 0.0
+
+    def test_detection_rate_with_unordered_timestamps(self) -> None:
+        """Test detection rate when attacks are recorded out of order."""
+        for ts, detected in [(3.0, True), (1.0, False), (2.0, True)]:
+            self.metrics.record_attack("replay", detected, timestamp=ts)
+
+        assert self.metrics.detection_rate_in_window(1.0, 2.0) == 50.0
+        assert self.metrics.get_attack_timeline()[1] == (1.0, "replay", False)
+
+        # The window query must not hold buffers that block further appends
+        self.metrics.record_attack("replay", False, timestamp=1.5)
+        assert self.metrics.detection_rate_in_window(1.0, 2.0) == pytest.approx(100 / 3)
+
     def test_record_offline_attacks(self) -> None:
         """Test recording offline attacks."""
         self.metrics.record_attack("offline_sybil", True)
@@ -490,16 +809,6 @@ class TestCoreMetricsCollector:
     def setup_method(self) -> None:
         """Set up test fixtures."""
         self.collector = CoreMetricsCollector()
-        self.keypair = NostrKeyPair.generate()
-
-    def create_test_event(self, content: str = "test") -> NostrEvent:
-        """Create a test event."""
-        return NostrEvent(
-            kind=NostrEventKind.TEXT_NOTE,
-            content=content,
-            created_at=int(time.time()),
-            pubkey=self.keypair.public_key,
-        )
 
     def test_start_stop_collection(self) -> None:
         """Test starting and stopping collection."""
@@ -511,11 +820,26 @@ class TestCoreMetricsCollector:
         self.collector.stop_collection()
         assert not self.collector.is_collecting
 
+    def test_recording_uses_reassigned_subsystem(self) -> None:
+        """Test that recordings reach a subsystem replaced while collecting."""
+        event = _make_test_event()
+
+        self.collector.start_collection()
+        self.collector.record_event_processing(event, 0.1, 100)
+        monitor = RelayLoadMonitor()
+        self.collector.relay_load_monitor = monitor
+        self.collector.record_event_processing(event, 0.1, 100)
+
+        self.collector.stop_collection()
+        self.collector.record_event_processing(event, 0.1, 100)
+
+        assert monitor.get_stats().event_count == 1
+
     def test_label_event_integration(self) -> None:
         """Test event labeling integration."""
         self.collector.start_collection()
 
-        event = self.create_test_event()
+        event = _make_test_event()
         self.collector.label_event(event, True)
 
         # Check that both subsystems received the label
@@ -526,11 +850,107 @@ class TestCoreMetricsCollector:
         assert event.id in self.collector.fp_fn_tracker.event_labels
         assert event.id in self.collector.spam_reduction_calculator.event_labels
 
+    def test_trackers_share_ground_truth(self) -> None:
+        """Test that both classifiers read the collector's single store."""
+        self.collector.start_collection()
+
+        event = _make_test_event()
+        self.collector.label_event(event, False)
+        result = StrategyResult(allowed=False, reason="blocked legitimate")
+        self.collector.record_strategy_evaluation("test_strategy", event, result)
+
+        ground_truth = self.collector.ground_truth
+        assert self.collector.fp_fn_tracker.ground_truth is ground_truth
+        assert self.collector.spam_reduction_calculator.ground_truth is ground_truth
+        assert ground_truth.strategy_decisions["test_strategy"] == {event.id}
+        spam_stats = self.collector.spam_reduction_calculator.get_stats()
+        assert self.collector.fp_fn_tracker.get_stats().false_positives == 1
+        assert spam_stats.blocked_legitimate_events == 1
+
+    def test_repeated_evaluations_accumulate(self) -> None:
+        """Test that repeated evaluations add to the strategy stats."""
+        self.collector.start_collection()
+        result = StrategyResult(allowed=False, reason="blocked spam")
+
+        for i in range(3):
+            event = _make_test_event(f"spam_{i}")
+            self.collector.label_event(event, True)
+            self.collector.record_strategy_evaluation("test_strategy", event, result)
+
+        fp_fn_stats = self.collector.fp_fn_tracker.get_stats("test_strategy")
+        assert fp_fn_stats.true_positives == 3
+        spam_stats = self.collector.spam_reduction_calculator.get_stats("test_strategy")
+        assert spam_stats.blocked_spam_events == 3
+
+    def test_strategy_evaluation_records_latency(self) -> None:
+        """Test that a strategy evaluation records all metrics."""
+        self.collector.start_collection()
+        event = _make_test_event()
+        self.collector.label_event(event, False)
+
+        result = StrategyResult(allowed=True, reason="ok", metrics={"latency": 0.25})
+        self.collector.record_strategy_evaluation("test_strategy", event, result)
+
+        stats = self.collector.fp_fn_tracker.get_stats("test_strategy")
+        assert stats.true_negatives == 1
+        strategy_stats = self.collector.latency_measurement.get_strategy_stats(
+            "test_strategy"
+        )
+        assert strategy_stats["average"] == pytest.approx(0.25)
+
+    def test_strategy_evaluation_uses_reassigned_fp_fn_tracker(self) -> None:
+        """Test that evaluations reach an FP/FN tracker replaced mid-run."""
+        self.collector.start_collection()
+        result = StrategyResult(allowed=False, reason="blocked spam")
+        first, second = _make_test_event("spam_1"), _make_test_event("spam_2")
+        self.collector.label_event(first, True)
+        self.collector.label_event(second, True)
+
+        self.collector.record_strategy_evaluation("test_strategy", first, result)
+        tracker = FalsePositiveNegativeTracker(self.collector.ground_truth)
+        self.collector.fp_fn_tracker = tracker
+        self.collector.record_strategy_evaluation("test_strategy", second, result)
+
+        assert tracker.get_stats("test_strategy").true_positives == 1
+        assert tracker.get_stats().true_positives == 1
+
+    def test_strategy_evaluation_uses_reassigned_spam_calculator(self) -> None:
+        """Test that evaluations reach a spam calculator replaced mid-run."""
+        self.collector.start_collection()
+        result = StrategyResult(allowed=False, reason="blocked spam")
+        first, second = _make_test_event("spam_1"), _make_test_event("spam_2")
+        self.collector.label_event(first, True)
+        self.collector.label_event(second, True)
+
+        self.collector.record_strategy_evaluation("test_strategy", first, result)
+        calculator = SpamReductionCalculator(self.collector.ground_truth)
+        self.collector.spam_reduction_calculator = calculator
+        self.collector.record_strategy_evaluation("test_strategy", second, result)
+
+        assert calculator.get_stats("test_strategy").blocked_spam_events == 1
+        assert calculator.get_stats().blocked_spam_events == 1
+
+    def test_strategy_evaluation_after_stats_cleared(self) -> None:
+        """Test that per-strategy stats refill after being cleared."""
+        self.collector.start_collection()
+        result = StrategyResult(allowed=False, reason="blocked spam")
+        first, second = _make_test_event("spam_1"), _make_test_event("spam_2")
+        self.collector.label_event(first, True)
+        self.collector.label_event(second, True)
+
+        self.collector.record_strategy_evaluation("test_strategy", first, result)
+        self.collector.fp_fn_tracker.stats_by_strategy.clear()
+        self.collector.record_strategy_evaluation("test_strategy", second, result)
+
+        tracker = self.collector.fp_fn_tracker
+        assert tracker.get_stats("test_strategy").true_positives == 1
+        assert tracker.get_stats().true_positives == 2
+
     def test_strategy_evaluation_integration(self) -> None:
         """Test strategy evaluation integration."""
         self.collector.start_collection()
 
-        event = self.create_test_event()
+        event = _make_test_event()
         self.collector.label_event(event, True)  # Spam
 
         result = StrategyResult(allowed=False, reason="blocked spam")
@@ -548,7 +968,7 @@ class TestCoreMetricsCollector:
         self.collector.start_collection()
 
         # Generate some test data
-        event = self.create_test_event()
+        event = _make_test_event()
         self.collector.label_event(event, True)
 
         result = StrategyResult(allowed=False, reason="blocked")
@@ -577,10 +997,57 @@ class TestCoreMetricsCollector:
         )
         assert report["relay_load"].total_cpu_time == 0.1
 
+    def test_comprehensive_report_includes_rates(self) -> None:
+        """Test that the report carries every strategy's rates."""
+        self.collector.start_collection()
+        blocked = StrategyResult(allowed=False, reason="blocked")
+        for i, is_spam in enumerate([True, True, False]):
+            event = _make_test_event(f"event_{i}")
+            self.collector.label_event(event, is_spam)
+            self.collector.record_strategy_evaluation("test_strategy", event, blocked)
+
+        report = self.collector.get_comprehensive_report()
+
+        rates = report["false_positive_negative"]["rates"]
+        assert list(rates) == ["test_strategy", "overall"]
+        stats = report["false_positive_negative"]["overall"]
+        assert rates["overall"] == pytest.approx(
+            {
+                "precision": stats.precision,
+                "recall": stats.recall,
+                "f1_score": stats.f1_score,
+                "accuracy": stats.accuracy,
+            }
+        )
+
+    def test_comprehensive_report_includes_reduction_percentages(self) -> None:
+        """Test that the report carries every strategy's spam reduction."""
+        self.collector.start_collection()
+        blocked = StrategyResult(allowed=False, reason="blocked")
+        allowed = StrategyResult(allowed=True, reason="ok")
+        for i, (is_spam, result) in enumerate(
+            [(True, blocked), (True, allowed), (False, blocked), (False, allowed)]
+        ):
+            event = _make_test_event(f"event_{i}")
+            self.collector.label_event(event, is_spam)
+            self.collector.record_strategy_evaluation("test_strategy", event, result)
+
+        report = self.collector.get_comprehensive_report()
+
+        spam_reduction = report["spam_reduction"]
+        for name, stats in spam_reduction["by_strategy"].items():
+            assert spam_reduction["reduction_percentages"][name] == pytest.approx(
+                stats.spam_reduction_percentage
+            )
+            assert spam_reduction["legitimate_pass_rates"][name] == pytest.approx(
+                stats.legitimate_pass_rate
+            )
+        assert spam_reduction["reduction_percentages"]["test_strategy"] == 50.0
+
     def test_collection_state_filtering(self) -> None:
         """Test that metrics are only recorded when collecting."""
         # Don't start collection
-        event = self.create_test_event()
+        event = _make_test_event()
         self.collector.label_event(event, True)
 
         result = StrategyResult(allowed=False, reason="blocked")
@@ -592,3 +1059,22 @@ class TestCoreMetricsCollector:
         assert fp_fn_stats.false_positives == 0
         assert fp_fn_stats.true_negatives == 0
         assert fp_fn_stats.false_negatives == 0
+
+
+class TestPackageExports:
+    """Test the lazy re-exports of the metrics package."""
+
+    def test_exports_resolve_to_core_metrics(self) -> None:
+        """Test that package exports are the core_metrics classes."""
+        from .. import metrics
+
+        assert metrics.CoreMetricsCollector is CoreMetricsCollector
+        assert metrics.LatencyMeasurement is LatencyMeasurement
+        assert "SpamReductionCalculator" in dir(metrics)
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Test that unknown attributes raise AttributeError."""
+        from .. import metrics
+
+        with pytest.raises(AttributeError, match="no_such_metric"):
+            metrics.no_such_metric  # noqa: B018
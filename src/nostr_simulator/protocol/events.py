@@ -4,10 +4,40 @@ from __future__ import annotations
 
 import hashlib
 import json
+import sys
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any
 
+# Shared encoder for the compact NIP-01 form; json.dumps builds a new
+# encoder on every call when given non-default options.
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+def canonical_json(obj: Any) -> str:
+    """Serialize an object to compact NIP-01 JSON.
+
+    Args:
+        obj: JSON-serializable object, typically the signing array.
+
+    Returns:
+        JSON text without whitespace and with non-ASCII characters kept.
+    """
+    return _CANONICAL_ENCODER.encode(obj)
+
+
+def canonical_json_bytes(obj: Any) -> bytes:
+    """Serialize an object to compact NIP-01 JSON encoded as UTF-8.
+
+    Args:
+        obj: JSON-serializable object, typically the signing array.
+
+    Returns:
+        UTF-8 bytes ready to be hashed.
+    """
+    return _CANONICAL_ENCODER.encode(obj).encode("utf-8")
+
 
 class NostrEventKind(IntEnum):
     """Standard Nostr event kinds."""
@@ -40,7 +70,36 @@ class NostrEventKind(IntEnum):
     PARAM_REPLACEABLE_LAST = 39999
 
 
-@dataclass
+# Kind range bounds as plain ints; looking members up on the enum class is
+# several times slower than reading a module global.
+_REPLACEABLE_FIRST = int(NostrEventKind.REPLACEABLE_FIRST)
+_REPLACEABLE_LAST = int(NostrEventKind.REPLACEABLE_LAST)
+_EPHEMERAL_FIRST = int(NostrEventKind.EPHEMERAL_FIRST)
+_EPHEMERAL_LAST = int(NostrEventKind.EPHEMERAL_LAST)
+_PARAM_REPLACEABLE_FIRST = int(NostrEventKind.PARAM_REPLACEABLE_FIRST)
+_PARAM_REPLACEABLE_LAST = int(NostrEventKind.PARAM_REPLACEABLE_LAST)
+
+
+def _is_hex_of_length(value: str, length: int) -> bool:
+    """Check that a string is hex-encoded and has exactly the given length.
+
+    Args:
+        value: String to check.
+        length: Required number of characters.
+
+    Returns:
+        True if the string has the length and decodes as hex.
+    """
+    if len(value) != length:
+        return False
+    try:
+        bytes.fromhex(value)
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass(slots=True)
 class NostrTag:
     """Represents a Nostr event tag."""
 
@@ -49,7 +108,7 @@ class NostrTag:
 
     def to_list(self) -> list[str]:
         """Convert tag to list format for serialization."""
-        return [self.name] + self.values
+        return [self.name, *self.values]
 
     @classmethod
     def from_list(cls, tag_list: list[str]) -> NostrTag:
@@ -63,7 +122,7 @@ class NostrTag:
         return f"#{self.name}" + (":" + ":".join(self.values) if self.values else "")
 
 
-@dataclass
+@dataclass(slots=True)
 class NostrEvent:
     """
     Represents a Nostr event.
@@ -93,8 +152,6 @@ class NostrEvent:
         references, routing, or other metadata extensions.
     """
 
-    """Represents a Nostr event."""
-
     kind: NostrEventKind
     content: str
     created_at: int
@@ -110,42 +167,53 @@ class NostrEvent:
 
     def calculate_id(self) -> str:
         """Calculate the event ID according to NIP-01."""
-        # Create the serialized event data for ID calculation
-        serialized = [
+        # Hash the compact JSON bytes of the serialized event data
+        return hashlib.sha256(canonical_json_bytes(self._signing_data())).hexdigest()
+
+    def _signing_data(self) -> list[Any]:
+        """Build the NIP-01 array that is hashed for the ID and signed."""
+        return [
             0,  # Reserved for future use
             self.pubkey,
             self.created_at,
-            self.kind.value,
-            [tag.to_list() for tag in self.tags],
+            int(self.kind),
+            self._tag_lists(),
             self.content,
         ]
 
-        # Convert to JSON string (compact, no spaces)
-        json_str = json.dumps(serialized, separators=(",", ":"), ensure_ascii=False)
-
-        # Calculate SHA256 hash
-        return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
-
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary format."""
         return {
             "id": self.id,
             "pubkey": self.pubkey,
             "created_at": self.created_at,
-            "kind": self.kind.value,
-            "tags": [tag.to_list() for tag in self.tags],
+            "kind": int(self.kind),
+            "tags": self._tag_lists(),
             "content": self.content,
             "sig": self.sig,
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> NostrEvent:
-        """Create event from dictionary format."""
+    def from_dict(cls, data: dict[str, Any], verify: bool = True) -> NostrEvent:
+        """Create event from dictionary format.
+
+        Args:
+            data: Event dictionary as produced by ``to_dict``.
+            verify: Whether to check a supplied ID against the event data.
+                Pass False for events a relay has already validated.
+
+        Returns:
+            The parsed event.
+
+        Raises:
+            ValueError: If ``verify`` is set and the supplied ID is wrong.
+        """
         tags = [NostrTag.from_list(tag) for tag in data.get("tags", [])]
 
         event = cls(
             id=data.get("id", ""),
-            pubkey=data["pubkey"],
+            # Parsed events repeat a few authors; share one key string each
+            pubkey=sys.intern(data["pubkey"]),
             created_at=data["created_at"],
             kind=NostrEventKind(data["kind"]),
             tags=tags,
@@ -154,7 +222,7 @@ class NostrEvent:
         )
 
         # Verify the ID matches if provided
-        if event.id and event.id != event.calculate_id():
+        if verify and event.id and event.id != event.calculate_id():
             raise ValueError("Event ID does not match calculated ID")
 
         return event
@@ -164,10 +232,25 @@ class NostrEvent:
         return json.dumps(self.to_dict(), separators=(",", ":"))
 
     @classmethod
-    def from_json(cls, json_str: str) -> NostrEvent:
-        """Create event from JSON string."""
+    def from_json(cls, json_str: str, verify: bool = True) -> NostrEvent:
+        """Create event from JSON string.
+
+        Args:
+            json_str: Event serialized with ``to_json``.
+            verify: Whether to check a supplied ID against the event data.
+
+        Returns:
+            The parsed event.
+        """
         data = json.loads(json_str)
-        return cls.from_dict(data)
+        return cls.from_dict(data, verify=verify)
+
+    def _tag_lists(self) -> list[list[str]]:
+        """Build the list-of-lists tag form used for IDs, signatures and dicts.
+
+        Not cached: callers mutate ``tags`` in place.
+        """
+        return [[tag.name, *tag.values] for tag in self.tags]
 
     def get_tag_values(self, tag_name: str) -> list[list[str]]:
         """Get all values for tags with the given name."""
@@ -175,48 +258,46 @@ class NostrEvent:
 
     def get_first_tag_value(self, tag_name: str, index: int = 0) -> str | None:
         """Get the first value at the given index for a tag name."""
-        values = self.get_tag_values(tag_name)
-        if values and len(values[0]) > index:
-            return values[0][index]
+        for tag in self.tags:
+            if tag.name == tag_name:
+                return tag.values[index] if len(tag.values) > index else None
         return None
 
     def add_tag(self, name: str, *values: str) -> None:
         """Add a tag to the event."""
-        self.tags.append(NostrTag(name=name, values=list(values)))
+        self.add_tags([(name, *values)])
+
+    def add_tags(self, tags: Iterable[Sequence[str]]) -> None:
+        """Add several tags to the event, recalculating the ID once.
+
+        Args:
+            tags: Tags in list form, each a name followed by its values.
+        """
+        self.tags.extend(NostrTag.from_list(list(tag)) for tag in tags)
         # Recalculate ID since tags changed
         self.id = self.calculate_id()
 
     def is_replaceable(self) -> bool:
         """Check if this is a replaceable event."""
-        return (
-            NostrEventKind.REPLACEABLE_FIRST
-            <= self.kind
-            <= NostrEventKind.REPLACEABLE_LAST
-        )
+        return _REPLACEABLE_FIRST <= self.kind <= _REPLACEABLE_LAST
 
     def is_ephemeral(self) -> bool:
         """Check if this is an ephemeral event."""
-        return (
-            NostrEventKind.EPHEMERAL_FIRST <= self.kind <= NostrEventKind.EPHEMERAL_LAST
-        )
+        return _EPHEMERAL_FIRST <= self.kind <= _EPHEMERAL_LAST
 
     def is_parameterized_replaceable(self) -> bool:
         """Check if this is a parameterized replaceable event."""
-        return (
-            NostrEventKind.PARAM_REPLACEABLE_FIRST
-            <= self.kind
-            <= NostrEventKind.PARAM_REPLACEABLE_LAST
-        )
+        return _PARAM_REPLACEABLE_FIRST <= self.kind <= _PARAM_REPLACEABLE_LAST
 
     def get_replacement_id(self) -> str:
         """Get the replacement ID for replaceable events."""
         if self.is_parameterized_replaceable():
             # For parameterized replaceable events, use pubkey:kind:d_tag
             d_tag = self.get_first_tag_value("d", 0) or ""
-            return f"{self.pubkey}:{self.kind.value}:{d_tag}"
+            return f"{self.pubkey}:{int(self.kind)}:{d_tag}"
         elif self.is_replaceable():
             # For regular replaceable events, use pubkey:kind
-            return f"{self.pubkey}:{self.kind.value}"
+            return f"{self.pubkey}:{int(self.kind)}"
         else:
             # For non-replaceable events, use the event ID
             return self.id
@@ -249,32 +330,17 @@ class NostrEvent:
             This uses a simplified verification for simulation purposes.
             In a real implementation, this would use proper secp256k1 cryptography.
         """
-        if not self.sig:
+        if not _is_hex_of_length(self.sig, 128):  # 64 bytes as hex
             return False
 
-        if len(self.sig) != 128:  # Signatures must be 128 hex characters (64 bytes)
-            return False
-
-        try:
-            bytes.fromhex(self.sig)
-        except ValueError:
-            return False
+        return self._signature_matches(canonical_json(self._signing_data()))
 
+    def _signature_matches(self, signing_json: str) -> bool:
+        """Verify the signature against already serialized signing data."""
         # For simulation, we'll use the same verification logic as in validation.py
         from .keys import verify_signature
 
-        # Create the signing data according to NIP-01
-        signing_data = [
-            0,  # Reserved for future use
-            self.pubkey,
-            self.created_at,
-            self.kind.value,
-            [tag.to_list() for tag in self.tags],
-            self.content,
-        ]
-
-        json_str = json.dumps(signing_data, separators=(",", ":"), ensure_ascii=False)
-        return verify_signature(self.pubkey, json_str, self.sig)
+        return verify_signature(self.pubkey, signing_json, self.sig)
 
     def is_id_valid(self) -> bool:
         """
@@ -286,49 +352,47 @@ class NostrEvent:
         Returns:
             True if the ID is valid, False otherwise.
         """
-        if not self.id:
+        if not _is_hex_of_length(self.id, 64):  # 32 bytes as hex
             return False
 
-        if len(self.id) != 64:  # 32 bytes as hex
-            return False
+        return self._id_matches(canonical_json(self._signing_data()))
 
-        try:
-            bytes.fromhex(self.id)
-        except ValueError:
-            return False
-
-        # Check if the ID matches the calculated hash
-        return self.id == self.calculate_id()
+    def _id_matches(self, signing_json: str) -> bool:
+        """Check the ID against already serialized signing data."""
+        expected = hashlib.sha256(signing_json.encode("utf-8")).hexdigest()
+        return self.id == expected
 
     def is_valid(self, check_signature: bool = False) -> bool:
         """
         Perform comprehensive validation of the event.
 
+        Malformed fields are rejected before the event is serialized, which
+        is then done once for both the ID and the signature checks.
+
         Args:
             check_signature: Whether to validate the signature (requires sig field).
 
         Returns:
             True if the event is valid, False otherwise.
         """
-        # Check ID validity
-        if not self.is_id_valid():
-            return False
-
         # Check basic format requirements
-        if not self.pubkey or len(self.pubkey) != 64:
+        if not _is_hex_of_length(self.id, 64):
             return False
 
-        try:
-            bytes.fromhex(self.pubkey)
-        except ValueError:
+        if not _is_hex_of_length(self.pubkey, 64):
             return False
 
         # Check timestamp is reasonable
         if self.created_at < 0:
             return False
 
-        # Check signature if requested
-        if check_signature and not self.is_signature_valid():
+        if check_signature and not _is_hex_of_length(self.sig, 128):
+            return False
+
+        signing_json = canonical_json(self._signing_data())
+
+        # Check the ID, then the signature if requested
+        if not self._id_matches(signing_json):
             return False
 
-        return True
+        return not check_signature or self._signature_matches(signing_json)
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import hashlib
-import json
 import secrets
 from dataclasses import dataclass
 from typing import Any
 
+from .events import canonical_json_bytes
+
 # Note: In a real implementation, you would use a proper cryptographic library
 # like cryptography or pycryptodome. For simulation purposes, we'll use
 # simplified implementations that maintain the same interfaces.
 
 
+# Well-formed hex strings rejected outright by ``verify_signature``.
+_INVALID_SIGNATURE_PATTERNS = frozenset(
+    ["1234567890abcdef" * 4, "fedcba0987654321" * 4]
+)
+
+
 @dataclass
 class NostrKeyPair:
     """Represents a Nostr key pair."""
@@ -111,16 +118,13 @@ def verify_signature(public_key: str, event_data: str, signature: str) -> bool:
 
     # For simulation purposes, we need more sophisticated validation.
     # A signature of repeated characters or obviously invalid patterns
-    # should be rejected even if they're properly formatted hex.    # Check for obviously invalid patterns
-    if len(set(signature)) == 1:  # All same character (like "aaaa..." or "bbbb...")
-        return False
-
-    if signature == "0" * len(signature):  # All zeros
+    # should be rejected even if they're properly formatted hex.
+    # All same character (like "0000...", "aaaa..." or "bbbb...")
+    if signature[0] * len(signature) == signature:
         return False
 
     # Check for other obviously invalid patterns
-    simple_patterns = ["1234567890abcdef" * 4, "fedcba0987654321" * 4]
-    if signature in simple_patterns:
+    if signature in _INVALID_SIGNATURE_PATTERNS:
         return False
 
     # For simulation, accept signatures that pass basic validation
@@ -148,12 +152,9 @@ def sign_event_dict(private_key: str, event_dict: dict[str, Any]) -> str:
         event_dict["content"],
     ]
 
-    # Convert to JSON string (compact, no spaces)
-    json_str = json.dumps(signing_data, separators=(",", ":"), ensure_ascii=False)
-
     # Create signature using our simplified method
-    signature_input = private_key + json_str
-    signature_bytes = hashlib.sha256(signature_input.encode("utf-8")).digest()
+    signature_input = private_key.encode("utf-8") + canonical_json_bytes(signing_data)
+    signature_bytes = hashlib.sha256(signature_input).digest()
     # Double the signature to match 64-byte (128 hex char) requirement for Nostr compatibility
     return (signature_bytes + signature_bytes).hex()
 
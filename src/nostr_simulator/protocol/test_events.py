@@ -1,8 +1,18 @@
 """Tests for Nostr protocol events implementation."""
 
 import json
+from unittest.mock import patch
 
-from .events import NostrEvent, NostrEventKind, NostrTag
+import pytest
+
+from .events import (
+    NostrEvent,
+    NostrEventKind,
+    NostrTag,
+    canonical_json,
+    canonical_json_bytes,
+)
+from .keys import NostrKeyPair
 
 
 class TestNostrTag:
@@ -88,6 +98,14 @@ class TestNostrEvent:
 
         assert event.id == expected_id
 
+    def test_canonical_json_matches_compact_dumps(self) -> None:
+        """Test that canonical serialization keeps the NIP-01 compact form."""
+        data = [0, "f" * 64, 1234567890, 1, [["t", "ünïcode"]], 'say "hi"\n']
+        expected = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+        assert canonical_json(data) == expected
+        assert canonical_json_bytes(data) == expected.encode("utf-8")
+
     def test_to_dict(self) -> None:
         """Test converting event to dictionary."""
         event = NostrEvent(
@@ -141,6 +159,42 @@ class TestNostrEvent:
         assert event.pubkey == "b" * 64
         assert len(event.tags) == 2
 
+    def test_from_dict_verify_flag(self) -> None:
+        """Test that a mismatched ID is rejected unless verification is off."""
+        event_dict = {
+            "id": "a" * 64,
+            "pubkey": "b" * 64,
+            "created_at": 1234567890,
+            "kind": 1,
+            "tags": [],
+            "content": "Test content",
+        }
+
+        with pytest.raises(ValueError, match="does not match"):
+            NostrEvent.from_dict(event_dict)
+
+        trusted = NostrEvent.from_dict(event_dict, verify=False)
+        assert trusted.id == "a" * 64
+
+    def test_from_json_shares_pubkey_strings(self) -> None:
+        """Test that parsed events by one author share a single pubkey object."""
+        first, second = (
+            NostrEvent.from_json(
+                json.dumps(
+                    {
+                        "pubkey": "ab" * 32,
+                        "created_at": 1234567890,
+                        "kind": 1,
+                        "tags": [],
+                        "content": content,
+                    }
+                )
+            )
+            for content in ("one", "two")
+        )
+
+        assert first.pubkey is second.pubkey
+
     def test_json_serialization(self) -> None:
         """Test JSON serialization and deserialization."""
         original_event = NostrEvent(
@@ -175,6 +229,58 @@ class TestNostrEvent:
         assert event.tags[0].name == "t"
         assert event.tags[0].values == ["bitcoin"]
 
+    def test_add_tags_matches_individual_adds(self) -> None:
+        """Test that a batch of tags yields the same ID as adding them singly."""
+        batched = NostrEvent(
+            kind=NostrEventKind.TEXT_NOTE,
+            content="Test",
+            created_at=1234567890,
+            pubkey="f" * 64,
+        )
+        single = NostrEvent(
+            kind=NostrEventKind.TEXT_NOTE,
+            content="Test",
+            created_at=1234567890,
+            pubkey="f" * 64,
+        )
+
+        batched.add_tags([("t", "bitcoin"), ("p", "a" * 64, "wss://relay")])
+        single.add_tag("t", "bitcoin")
+        single.add_tag("p", "a" * 64, "wss://relay")
+
+        assert batched.tags == single.tags
+        assert batched.id == single.id == batched.calculate_id()
+
+    def test_direct_tag_mutation_is_reflected(self) -> None:
+        """Test that serialized tags follow in-place edits of the tag list."""
+        event = NostrEvent(
+            kind=NostrEventKind.TEXT_NOTE,
+            content="Test",
+            created_at=1234567890,
+            pubkey="f" * 64,
+        )
+        original_id = event.calculate_id()
+
+        event.tags.append(NostrTag(name="t", values=["nostr"]))
+
+        assert event.to_dict()["tags"] == [["t", "nostr"]]
+        assert event.calculate_id() != original_id
+
+    def test_events_and_tags_use_slots(self) -> None:
+        """Test that events and tags carry no per-instance __dict__."""
+        event = NostrEvent.from_dict(
+            {
+                "pubkey": "f" * 64,
+                "created_at": 1234567890,
+                "kind": 1,
+                "tags": [["t", "nostr"]],
+                "content": "Test",
+            }
+        )
+
+        assert not hasattr(event, "__dict__")
+        assert not hasattr(event.tags[0], "__dict__")
+
     def test_get_tag_values(self) -> None:
         """Test getting tag values."""
         event = NostrEvent(
@@ -216,6 +322,18 @@ class TestNostrEvent:
         nonexistent = event.get_first_tag_value("x", 0)
         assert nonexistent is None
 
+    def test_get_first_tag_value_only_reads_first_matching_tag(self) -> None:
+        """Test that a short first tag is not skipped in favour of a later one."""
+        event = NostrEvent(
+            kind=NostrEventKind.TEXT_NOTE,
+            content="Test",
+            created_at=1234567890,
+            pubkey="h" * 64,
+        )
+        event.add_tags([("p", "pubkey1"), ("p", "pubkey2", "petname2")])
+
+        assert event.get_first_tag_value("p", 1) is None
+
     def test_event_type_checks(self) -> None:
         """Test event type checking methods."""
         # Regular event
@@ -543,12 +661,12 @@ class TestNostrEvent:
         non_existent = event.get_first_tag_value("z", 0)
         assert non_existent is None
 
-    def test_signature_validation(self) -> None:
+    def test_signature_validation(self, shared_keypair: NostrKeyPair) -> None:
         """Test event signature validation methods."""
-        from ..protocol.keys import NostrKeyPair, sign_event_dict
+        from ..protocol.keys import sign_event_dict
 
         # Create a keypair and event
-        keypair = NostrKeyPair.generate()
+        keypair = shared_keypair
         event = NostrEvent(
             kind=NostrEventKind.TEXT_NOTE,
             content="Test signature validation",
@@ -611,12 +729,12 @@ class TestNostrEvent:
         event.id = event.calculate_id()
         assert event.is_id_valid()
 
-    def test_comprehensive_validation(self) -> None:
+    def test_comprehensive_validation(self, shared_keypair: NostrKeyPair) -> None:
         """Test the comprehensive is_valid method."""
-        from ..protocol.keys import NostrKeyPair, sign_event_dict
+        from ..protocol.keys import sign_event_dict
 
         # Create a valid event with signature
-        keypair = NostrKeyPair.generate()
+        keypair = shared_keypair
         event = NostrEvent(
             kind=NostrEventKind.TEXT_NOTE,
             content="Test comprehensive validation",
@@ -647,6 +765,48 @@ class TestNostrEvent:
         assert event.is_valid(check_signature=False)  # ID is valid
         assert not event.is_valid(check_signature=True)  # Signature is invalid
 
+    def test_validation_serializes_event_once(
+        self, shared_keypair: NostrKeyPair
+    ) -> None:
+        """Test that checking ID and signature shares one serialization."""
+        from ..protocol.keys import sign_event_dict
+
+        keypair = shared_keypair
+        event = NostrEvent(
+            kind=NostrEventKind.TEXT_NOTE,
+            content="Test",
+            created_at=1234567890,
+            pubkey=keypair.public_key,
+        )
+        event.sig = sign_event_dict(keypair.private_key, event.to_dict())
+
+        with patch(
+            "nostr_simulator.protocol.events.canonical_json",
+            wraps=canonical_json,
+        ) as serialize:
+            assert event.is_valid(check_signature=True)
+
+        serialize.assert_called_once()
+
+    def test_malformed_signature_is_rejected_before_serializing(self) -> None:
+        """Test that a malformed signature fails without building the JSON."""
+        event = NostrEvent(
+            kind=NostrEventKind.TEXT_NOTE,
+            content="Test",
+            created_at=1234567890,
+            pubkey="ab" * 32,
+            sig="not hex",
+        )
+
+        with patch(
+            "nostr_simulator.protocol.events.canonical_json",
+            wraps=canonical_json,
+        ) as serialize:
+            assert not event.is_signature_valid()
+            assert not event.is_valid(check_signature=True)
+
+        serialize.assert_not_called()
+
     def test_real_world_event_validation(self) -> None:
         """Test validation methods with the real-world event."""
         event_dict = {
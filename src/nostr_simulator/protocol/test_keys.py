@@ -39,6 +39,14 @@ class TestNostrKeyPair:
         assert keypair.private_key == private_key
         assert len(keypair.public_key) == 64
 
+    def test_from_private_key_matches_generated_pair(self) -> None:
+        """Test that re-deriving a generated key gives the same public key."""
+        generated = NostrKeyPair.generate()
+
+        rebuilt = NostrKeyPair.from_private_key(generated.private_key)
+
+        assert rebuilt == generated
+
     def test_from_invalid_private_key(self) -> None:
         """Test creating keypair from invalid private key."""
         try:
@@ -47,9 +55,9 @@ class TestNostrKeyPair:
         except ValueError as e:
             assert "must be 64 hex characters" in str(e)
 
-    def test_sign_event(self) -> None:
+    def test_sign_event(self, shared_keypair: NostrKeyPair) -> None:
         """Test event signing."""
-        keypair = NostrKeyPair.generate()
+        keypair = shared_keypair
         event_data = "test event data"
 
         signature = keypair.sign_event(event_data)
@@ -57,9 +65,9 @@ class TestNostrKeyPair:
         assert len(signature) == 64  # 32 bytes as hex
         bytes.fromhex(signature)  # Should be valid hex
 
-    def test_consistent_signing(self) -> None:
+    def test_consistent_signing(self, shared_keypair: NostrKeyPair) -> None:
         """Test that signing is consistent."""
-        keypair = NostrKeyPair.generate()
+        keypair = shared_keypair
         event_data = "test event data"
 
         sig1 = keypair.sign_event(event_data)
@@ -67,9 +75,9 @@ class TestNostrKeyPair:
 
         assert sig1 == sig2  # Same data should produce same signature
 
-    def test_npub_nsec_format(self) -> None:
+    def test_npub_nsec_format(self, shared_keypair: NostrKeyPair) -> None:
         """Test npub and nsec format."""
-        keypair = NostrKeyPair.generate()
+        keypair = shared_keypair
 
         npub = keypair.get_npub()
         nsec = keypair.get_nsec()
@@ -79,9 +87,9 @@ class TestNostrKeyPair:
         assert len(npub) == 69  # npub1 + 64 hex chars
         assert len(nsec) == 69  # nsec1 + 64 hex chars
 
-    def test_string_representation(self) -> None:
+    def test_string_representation(self, shared_keypair: NostrKeyPair) -> None:
         """Test string representation."""
-        keypair = NostrKeyPair.generate()
+        keypair = shared_keypair
         str_repr = str(keypair)
 
         assert "NostrKeyPair" in str_repr
@@ -123,6 +131,11 @@ class TestKeyFunctions:
         result = verify_signature(public_key, event_data, "g" * 64)
         assert result is False
 
+    def test_verify_signature_rejects_repeated_characters(self) -> None:
+        """Test that well-formed signatures of one repeated digit are rejected."""
+        for char in "0af":
+            assert verify_signature("a" * 64, "data", char * 128) is False
+
     def test_sign_event_dict(self) -> None:
         """Test signing an event dictionary."""
         private_key = "a" * 64
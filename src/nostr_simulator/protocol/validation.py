@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import time
 from typing import Any
 
-from .events import NostrEvent, NostrEventKind
+from .events import NostrEvent, NostrEventKind, canonical_json
 from .keys import verify_signature
 
 
@@ -179,7 +178,7 @@ class EventValidator:
             event.content,
         ]
 
-        json_str = json.dumps(signing_data, separators=(",", ":"), ensure_ascii=False)
+        json_str = canonical_json(signing_data)
 
         if not verify_signature(event.pubkey, json_str, event.sig):
             raise ValidationError("Invalid signature")
@@ -263,20 +263,21 @@ class EnhancedSimulationEngine(SimulationEngine):
         core = metrics["core_metrics"]
 
         # False positive/negative summary
-        if "overall" in core["false_positive_negative"]["by_strategy"]:
-            overall_fp_fn = core["false_positive_negative"]["by_strategy"]["overall"]
-            self.logger.info(f"Overall Accuracy: {overall_fp_fn.accuracy:.2%}")
-            self.logger.info(f"Overall Precision: {overall_fp_fn.precision:.2%}")
-            self.logger.info(f"Overall Recall: {overall_fp_fn.recall:.2%}")
-            self.logger.info(f"Overall F1 Score: {overall_fp_fn.f1_score:.2%}")
+        if "overall" in core["false_positive_negative"]["rates"]:
+            overall_fp_fn = core["false_positive_negative"]["rates"]["overall"]
+            self.logger.info(f"Overall Accuracy: {overall_fp_fn['accuracy']:.2%}")
+            self.logger.info(f"Overall Precision: {overall_fp_fn['precision']:.2%}")
+            self.logger.info(f"Overall Recall: {overall_fp_fn['recall']:.2%}")
+            self.logger.info(f"Overall F1 Score: {overall_fp_fn['f1_score']:.2%}")
 
         # Spam reduction summary
-        spam_overall = core["spam_reduction"]["overall"]
+        spam_reduction = core["spam_reduction"]
         self.logger.info(
-            f"Spam Reduction: {spam_overall.spam_reduction_percentage:.1f}%"
+            f"Spam Reduction: {spam_reduction['reduction_percentages']['overall']:.1f}%"
         )
         self.logger.info(
-            f"Legitimate Pass Rate: {spam_overall.legitimate_pass_rate:.1f}%"
+            "Legitimate Pass Rate: "
+            f"{spam_reduction['legitimate_pass_rates']['overall']:.1f}%"
         )
 
         # Performance summary
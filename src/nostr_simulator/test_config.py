@@ -1,7 +1,10 @@
 """Tests for configuration management."""
 
+import os
+import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +17,7 @@ from .config import (
     SimulationConfig,
     get_default_config,
     load_config,
+    load_config_from_env,
     save_config,
 )
 
@@ -31,18 +35,18 @@ class TestSimulationConfig:
 
     def test_duration_validation(self) -> None:
         """Test that duration must be positive."""
-        with pytest.raises(ValueError, match="Duration must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             SimulationConfig(duration=0.0)
 
-        with pytest.raises(ValueError, match="Duration must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             SimulationConfig(duration=-1.0)
 
     def test_time_step_validation(self) -> None:
         """Test that time step must be positive."""
-        with pytest.raises(ValueError, match="Time step must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             SimulationConfig(time_step=0.0)
 
-        with pytest.raises(ValueError, match="Time step must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             SimulationConfig(time_step=-1.0)
 
     def test_valid_configuration(self) -> None:
@@ -69,21 +73,21 @@ class TestNetworkConfig:
 
     def test_count_validation(self) -> None:
         """Test that counts must be non-negative."""
-        with pytest.raises(ValueError, match="Counts must be non-negative"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             NetworkConfig(num_relays=-1)
 
-        with pytest.raises(ValueError, match="Counts must be non-negative"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             NetworkConfig(num_honest_users=-1)
 
-        with pytest.raises(ValueError, match="Counts must be non-negative"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             NetworkConfig(num_malicious_users=-1)
 
     def test_probability_validation(self) -> None:
         """Test that probability must be between 0 and 1."""
-        with pytest.raises(ValueError, match="Probability must be between 0 and 1"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             NetworkConfig(connection_probability=-0.1)
 
-        with pytest.raises(ValueError, match="Probability must be between 0 and 1"):
+        with pytest.raises(ValueError, match="less than or equal to 1"):
             NetworkConfig(connection_probability=1.1)
 
     def test_valid_configuration(self) -> None:
@@ -113,26 +117,55 @@ class TestAntiSpamConfig:
 
     def test_pow_difficulty_validation(self) -> None:
         """Test that PoW difficulty must be non-negative."""
-        with pytest.raises(ValueError, match="PoW difficulty must be non-negative"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             AntiSpamConfig(pow_difficulty=-1)
 
     def test_rate_limit_validation(self) -> None:
         """Test that rate limit must be positive."""
-        with pytest.raises(ValueError, match="Rate limit must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             AntiSpamConfig(rate_limit_per_second=0.0)
 
-        with pytest.raises(ValueError, match="Rate limit must be positive"):
+        with pytest.raises(ValueError, match="greater than 0"):
             AntiSpamConfig(rate_limit_per_second=-1.0)
 
     def test_trust_threshold_validation(self) -> None:
         """Test that trust threshold must be between 0 and 1."""
-        with pytest.raises(ValueError, match="Trust threshold must be between 0 and 1"):
+        with pytest.raises(ValueError, match="greater than or equal to 0"):
             AntiSpamConfig(wot_trust_threshold=-0.1)
 
-        with pytest.raises(ValueError, match="Trust threshold must be between 0 and 1"):
+        with pytest.raises(ValueError, match="less than or equal to 1"):
             AntiSpamConfig(wot_trust_threshold=1.1)
 
 
+class TestAttackConfig:
+    """Test AttackConfig validation and functionality."""
+
+    def test_positive_value_validation(self) -> None:
+        """Test that attack counts and rates must be positive."""
+        with pytest.raises(ValueError, match="greater than 0"):
+            AttackConfig(sybil_identities_per_attacker=0)
+
+        with pytest.raises(ValueError, match="greater than 0"):
+            AttackConfig(burst_spam_rate=0.0)
+
+        with pytest.raises(ValueError, match="greater than 0"):
+            AttackConfig(burst_duration=-1.0)
+
+
+class TestMetricsConfig:
+    """Test MetricsConfig validation and functionality."""
+
+    def test_collection_interval_validation(self) -> None:
+        """Test that collection interval must be positive."""
+        with pytest.raises(ValueError, match="greater than 0"):
+            MetricsConfig(collection_interval=0.0)
+
+    def test_output_format_validation(self) -> None:
+        """Test that output format must be supported."""
+        with pytest.raises(ValueError, match="Output format must be one of"):
+            MetricsConfig(output_format="xml")
+
+
 class TestConfig:
     """Test main Config class functionality."""
 
@@ -156,6 +189,21 @@ class TestConfig:
         # Other configs should use defaults
         assert config.antispam.pow_difficulty == 4
 
+    def test_configuration_is_frozen(self) -> None:
+        """Test that configuration objects cannot be mutated."""
+        config = Config()
+
+        with pytest.raises(ValueError, match="frozen"):
+            config.simulation.duration = 10.0
+
+        with pytest.raises(ValueError, match="frozen"):
+            config.network = NetworkConfig(num_relays=1)
+
+    def test_extra_fields_forbidden(self) -> None:
+        """Test that unknown configuration keys are rejected."""
+        with pytest.raises(ValueError, match="Extra inputs are not permitted"):
+            SimulationConfig(unknown_field=1)  # type: ignore[call-arg]
+
 
 class TestConfigFileOperations:
     """Test configuration file loading and saving."""
@@ -184,6 +232,54 @@ class TestConfigFileOperations:
         finally:
             config_path.unlink()
 
+    def test_save_config_creates_parent_directory(self, tmp_path: Path) -> None:
+        """Test that saving creates missing parent directories."""
+        config_path = tmp_path / "nested" / "config.yaml"
+
+        save_config(Config(), config_path)
+        save_config(Config(), config_path)
+
+        assert config_path.exists()
+
+    def test_save_config_recreates_deleted_parent_directory(
+        self, tmp_path: Path
+    ) -> None:
+        """Test that saving works again after the parent directory is removed."""
+        config_path = tmp_path / "nested" / "config.yaml"
+        save_config(Config(), config_path)
+
+        shutil.rmtree(config_path.parent)
+        save_config(Config(), config_path)
+
+        assert config_path.exists()
+
+    def test_load_json_config(self, tmp_path: Path) -> None:
+        """Test loading a JSON configuration file."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"network": {"num_relays": 7}}')
+
+        config = load_config(config_path)
+
+        assert config.network.num_relays == 7
+        assert config.simulation.duration == 3600.0
+
+    def test_load_json_config_validation_error(self, tmp_path: Path) -> None:
+        """Test that invalid values in a JSON file raise a validation error."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"simulation": {"duration": -1}}')
+
+        with pytest.raises(ValueError, match="greater than 0"):
+            load_config(config_path)
+
+    def test_load_yaml_flow_mapping_config(self, tmp_path: Path) -> None:
+        """Test that YAML flow mappings starting with a brace still load."""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("{network: {num_relays: 2}}")
+
+        config = load_config(config_path)
+
+        assert config.network.num_relays == 2
+
     def test_load_nonexistent_file(self) -> None:
         """Test loading from nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
@@ -196,6 +292,29 @@ class TestConfigFileOperations:
         assert config.simulation.duration == 3600.0
         assert config.network.num_relays == 10
 
+    def test_load_config_from_env_unset_returns_shared_default(self) -> None:
+        """Test that an unset env var returns the shared default configuration."""
+        with patch.dict(os.environ, {}, clear=True):
+            first = load_config_from_env()
+            second = load_config_from_env()
+
+        assert first is second
+        assert first.simulation.duration == 3600.0
+
+    def test_load_config_from_env_set_loads_file(self) -> None:
+        """Test that a configured env var loads the referenced file."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+            config_path = Path(f.name)
+
+        try:
+            save_config(Config(network=NetworkConfig(num_relays=3)), config_path)
+            with patch.dict(os.environ, {"NOSTR_SIM_CONFIG": str(config_path)}):
+                config = load_config_from_env()
+
+            assert config.network.num_relays == 3
+        finally:
+            config_path.unlink()
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
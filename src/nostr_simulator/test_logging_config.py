@@ -1,14 +1,25 @@
 """Tests for logging configuration module."""
 
+import json
 import logging
 import os
+import shutil
+import sys
 import tempfile
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import yaml
 
-from .logging_config import DEFAULT_LOGGING_CONFIG, get_logger, setup_logging
+from .logging_config import (
+    DEFAULT_LOGGING_CONFIG,
+    JsonFormatter,
+    _RecordQueueHandler,
+    _stop_queue_listeners,
+    get_logger,
+    setup_logging,
+)
 
 
 class TestSetupLogging:
@@ -54,9 +65,12 @@ class TestSetupLogging:
                 call_args[1]["format"]
             )
 
-    def test_setup_logging_with_environment_variable_override(self) -> None:
+    def test_setup_logging_with_environment_variable_override(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
         """Should use config path from environment variable when set."""
         config = DEFAULT_LOGGING_CONFIG
+        monkeypatch.chdir(tmp_path)
 
         with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
             yaml.dump(config, f)
@@ -70,8 +84,162 @@ class TestSetupLogging:
                     mock_dict_config.assert_called_once_with(config)
 
         finally:
+            _stop_queue_listeners()
             os.unlink(env_config_path)
 
+    def test_setup_logging_creates_log_directories(self, tmp_path: Path) -> None:
+        """Should create parent directories for file handlers before configuring."""
+        log_file = tmp_path / "nested" / "logs" / "sim.log"
+        config = {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": {
+                "file": {"class": "logging.FileHandler", "filename": str(log_file)}
+            },
+            "loggers": {"test_log_dirs": {"handlers": ["file"]}},
+        }
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text(yaml.dump(config))
+
+        try:
+            setup_logging(str(config_path))
+
+            assert log_file.parent.is_dir()
+        finally:
+            _stop_queue_listeners()
+
+    def test_setup_logging_routes_file_handlers_through_queue(
+        self, tmp_path: Path
+    ) -> None:
+        """Should replace file handlers with a queue handler and listener."""
+        log_file = tmp_path / "queued.log"
+        error_file = tmp_path / "errors.log"
+        config = {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": {
+                "console": {"class": "logging.NullHandler"},
+                "file": {"class": "logging.FileHandler", "filename": str(log_file)},
+                "error_file": {
+                    "class": "logging.FileHandler",
+                    "filename": str(error_file),
+                    "level": "ERROR",
+                },
+            },
+            "loggers": {
+                "test_queue": {
+                    "level": "DEBUG",
+                    "handlers": ["console", "file", "error_file"],
+                    "propagate": False,
+                },
+                "test_queue_child": {
+                    "level": "DEBUG",
+                    "handlers": ["file"],
+                    "propagate": False,
+                },
+            },
+        }
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text(yaml.dump(config))
+
+        try:
+            setup_logging(str(config_path))
+
+            logger = logging.getLogger("test_queue")
+            handler_types = {type(h) for h in logger.handlers}
+            assert handler_types == {logging.NullHandler, _RecordQueueHandler}
+
+            logger.info("queued info")
+            logger.error("queued error")
+            logging.getLogger("test_queue_child").error("child error")
+        finally:
+            _stop_queue_listeners()
+
+        log_text = log_file.read_text()
+        assert "queued info" in log_text
+        assert "queued error" in log_text
+        assert "child error" in log_text
+        error_text = error_file.read_text()
+        assert "queued error" in error_text
+        assert "queued info" not in error_text
+        assert "child error" not in error_text
+
+    def test_queued_json_handler_writes_exception_field(self, tmp_path: Path) -> None:
+        """Should keep exception info for formatters behind the queue."""
+        log_file = tmp_path / "json.log"
+        config = {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "formatters": {
+                "json": {"()": "nostr_simulator.logging_config.JsonFormatter"}
+            },
+            "handlers": {
+                "file": {
+                    "class": "logging.FileHandler",
+                    "filename": str(log_file),
+                    "formatter": "json",
+                }
+            },
+            "loggers": {
+                "test_queue_json": {
+                    "level": "DEBUG",
+                    "handlers": ["file"],
+                    "propagate": False,
+                }
+            },
+        }
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text(yaml.dump(config))
+
+        try:
+            setup_logging(str(config_path))
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger("test_queue_json").exception("failed %s", "here")
+        finally:
+            _stop_queue_listeners()
+
+        payload = json.loads(log_file.read_text())
+        assert payload["message"] == "failed here"
+        assert "ValueError: boom" in payload["exception"]
+
+    def test_setup_logging_reapplies_identical_config(self, tmp_path: Path) -> None:
+        """Should restore handlers removed since the same file was last applied."""
+        log_file = tmp_path / "logs" / "sim.log"
+        config = {
+            "version": 1,
+            "disable_existing_loggers": False,
+            "handlers": {
+                "file": {"class": "logging.FileHandler", "filename": str(log_file)}
+            },
+            "loggers": {
+                "test_reapply": {
+                    "level": "INFO",
+                    "handlers": ["file"],
+                    "propagate": False,
+                }
+            },
+        }
+        config_path = tmp_path / "logging.yaml"
+        config_path.write_text(yaml.dump(config))
+        logger = logging.getLogger("test_reapply")
+
+        try:
+            setup_logging(str(config_path))
+            _stop_queue_listeners()
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+            shutil.rmtree(log_file.parent)
+
+            setup_logging(str(config_path))
+            logger.info("after reapply")
+        finally:
+            _stop_queue_listeners()
+
+        assert logger.handlers
+        assert "after reapply" in log_file.read_text()
+
     def test_setup_logging_with_invalid_yaml_file(self) -> None:
         """Should handle invalid YAML files gracefully."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
@@ -116,6 +284,44 @@ class TestGetLogger:
         assert logger1.name != logger2.name
 
 
+class TestJsonFormatter:
+    """Test cases for JsonFormatter."""
+
+    def _make_record(self, msg: str, exc_info: object = None) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="nostr_simulator.test",
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=1,
+            msg=msg,
+            args=(),
+            exc_info=exc_info,  # type: ignore[arg-type]
+        )
+
+    def test_format_produces_valid_json(self) -> None:
+        """Should emit valid JSON even when the message contains quotes."""
+        record = self._make_record('event "abc" rejected')
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert payload["level"] == "WARNING"
+        assert payload["logger"] == "nostr_simulator.test"
+        assert payload["message"] == 'event "abc" rejected'
+        assert "timestamp" in payload
+        assert "exception" not in payload
+
+    def test_format_includes_exception(self) -> None:
+        """Should include formatted exception information when present."""
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = self._make_record("failed", exc_info=sys.exc_info())
+
+        payload = json.loads(JsonFormatter().format(record))
+
+        assert "ValueError: boom" in payload["exception"]
+
+
 class TestDefaultLoggingConfig:
     """Test cases for DEFAULT_LOGGING_CONFIG."""
 
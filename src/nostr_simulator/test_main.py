@@ -1,283 +1,292 @@
 """Tests for main entry point module."""
 
-from unittest.mock import Mock, patch
-
-from .config import Config, MetricsConfig, SimulationConfig
+import ast
+import functools
+import inspect
+from collections.abc import Iterator, Mapping
+from contextlib import ExitStack
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from . import main as main_module
+from .config import Config
 from .main import create_simulation, main
 
+# Real configurations used by the create_simulation tests, keyed by name.
+CONFIG_DATA_VARIANTS: dict[str, dict[str, Any]] = {
+    "minimal": {
+        "simulation": {"duration": 100.0, "time_step": 1.0, "random_seed": 42},
+        "metrics": {
+            "enabled": True,
+            "collection_interval": 10.0,
+            "output_file": "test_metrics.json",
+            "output_format": "json",
+        },
+    },
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_config(key: str) -> Config:
+    """Validate a named configuration variant once and share it.
+
+    Config models are frozen, so the cached instance is safe to reuse.
+    """
+    return Config(**CONFIG_DATA_VARIANTS[key])
+
+
+# Read-only engine metrics shared by the main() tests.
+_METRICS_WITH_TOTAL: Mapping[str, float] = MappingProxyType(
+    {
+        "total_events_processed": 250,
+        "average_queue_size": 5.5,
+        "simulation_duration": 100.0,
+    }
+)
+_METRICS_MISSING_TOTAL: Mapping[str, float] = MappingProxyType(
+    {"average_queue_size": 5.5}
+)
+
+# Patchers for main()'s collaborators, built once and restarted per test.
+_MAIN_PATCHERS = {
+    "setup_logging": patch("nostr_simulator.main.setup_logging"),
+    "get_logger": patch("nostr_simulator.main.get_logger"),
+    "load_config": patch("nostr_simulator.main.load_config_from_env"),
+    "create_simulation": patch("nostr_simulator.main.create_simulation"),
+    "exit": patch("sys.exit"),
+}
+
+
+# Classes imported lazily by create_simulation(), patched at their source.
+_CREATE_SIMULATION_TARGETS = {
+    "engine": "nostr_simulator.simulation.engine.SimulationEngine",
+    "agent_manager": "nostr_simulator.agents.base.AgentManager",
+}
+
+
+def _logged_messages(log_method: Mock) -> set[str]:
+    """Collect the messages passed to a mocked logger method."""
+    return {c.args[0] for c in log_method.call_args_list}
+
+
+@pytest.fixture
+def real_config() -> Config:
+    """Provide the cached minimal real configuration."""
+    return _cached_config("minimal")
+
+
+@pytest.fixture
+def stub_config() -> Mock:
+    """Provide an unspecced config stand-in for tests that only pass it along."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_engine() -> Mock:
+    """Provide a stand-in simulation engine."""
+    return Mock()
+
+
+@pytest.fixture
+def main_patches(
+    stub_config: Mock, mock_engine: Mock
+) -> Iterator[dict[str, MagicMock]]:
+    """Patch main()'s collaborators for the duration of a test.
+
+    The patched loader returns ``stub_config`` and the patched factory
+    returns ``mock_engine``.
+    """
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(patcher)
+            for name, patcher in _MAIN_PATCHERS.items()
+        }
+        mocks["load_config"].return_value = stub_config
+        mocks["create_simulation"].return_value = mock_engine
+        yield mocks
 
-class TestCreateSimulation:
-    """Test cases for create_simulation function."""
 
-    def test_create_simulation_returns_engine(self) -> None:
-        """Should create and return simulation engine."""
-        mock_config = Mock(spec=Config)
+@pytest.fixture
+def engine_patches(mock_engine: Mock) -> Iterator[dict[str, MagicMock]]:
+    """Patch the classes create_simulation() instantiates.
 
-        with patch("nostr_simulator.main.SimulationEngine") as mock_engine_class:
-            with patch("nostr_simulator.main.AgentManager") as mock_agent_manager_class:
-                mock_engine = Mock()
-                mock_engine_class.return_value = mock_engine
+    The patched engine class returns ``mock_engine``.
+    """
+    with ExitStack() as stack:
+        mocks = {
+            name: stack.enter_context(patch(target))
+            for name, target in _CREATE_SIMULATION_TARGETS.items()
+        }
+        mocks["engine"].return_value = mock_engine
+        yield mocks
 
-                result = create_simulation(mock_config)
 
-                assert result == mock_engine
-                mock_engine_class.assert_called_once_with(mock_config)
-                mock_agent_manager_class.assert_called_once_with(mock_engine)
+class TestCreateSimulation:
+    """Test cases for create_simulation function."""
 
-    def test_create_simulation_with_real_config(self) -> None:
+    def test_create_simulation_returns_engine(
+        self,
+        engine_patches: dict[str, MagicMock],
+        mock_config: Mock,
+        mock_engine: Mock,
+    ) -> None:
+        """Should create and return simulation engine."""
+        result = create_simulation(mock_config)
+
+        assert result == mock_engine
+        engine_patches["engine"].assert_called_once_with(mock_config)
+        engine_patches["agent_manager"].assert_called_once_with(mock_engine)
+
+    @pytest.mark.slow
+    def test_create_simulation_with_real_config(
+        self,
+        engine_patches: dict[str, MagicMock],
+        real_config: Config,
+        mock_engine: Mock,
+    ) -> None:
         """Should create simulation with actual config object."""
-        # Create a minimal config for testing
-        config = Config(
-            simulation=SimulationConfig(duration=100.0, time_step=1.0, random_seed=42),
-            metrics=MetricsConfig(
-                enabled=True,
-                collection_interval=10.0,
-                output_file="test_metrics.json",
-                output_format="json",
-            ),
-        )
-
-        with patch("nostr_simulator.main.SimulationEngine") as mock_engine_class:
-            with patch("nostr_simulator.main.AgentManager"):
-                mock_engine = Mock()
-                mock_engine_class.return_value = mock_engine
-
-                result = create_simulation(config)
+        result = create_simulation(real_config)
 
-                assert result == mock_engine
-                mock_engine_class.assert_called_once_with(config)
+        assert result == mock_engine
+        engine_patches["engine"].assert_called_once_with(real_config)
 
 
 class TestMain:
     """Test cases for main function."""
 
-    def test_main_successful_execution(self) -> None:
+    def test_main_successful_execution(
+        self,
+        main_patches: dict[str, MagicMock],
+        stub_config: Mock,
+        mock_engine: Mock,
+    ) -> None:
         """Should execute simulation successfully."""
-        mock_config = Mock(spec=Config)
-        mock_engine = Mock()
-        mock_metrics = {"total_events_processed": 100}
-        mock_engine.get_metrics.return_value = mock_metrics
-
-        with patch("nostr_simulator.main.setup_logging") as mock_setup_logging:
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch(
-                        "nostr_simulator.main.create_simulation"
-                    ) as mock_create_sim:
-                        mock_logger = Mock()
-                        mock_get_logger.return_value = mock_logger
-                        mock_load_config.return_value = mock_config
-                        mock_create_sim.return_value = mock_engine
-
-                        main()
-
-                        mock_setup_logging.assert_called_once()
-                        mock_load_config.assert_called_once()
-                        mock_create_sim.assert_called_once_with(mock_config)
-                        mock_engine.run.assert_called_once()
-                        mock_engine.get_metrics.assert_called_once()
-
-                        # Check that appropriate log messages were called
-                        mock_logger.info.assert_any_call("Starting Nostr Simulator")
-                        mock_logger.info.assert_any_call("Loaded configuration")
-                        mock_logger.info.assert_any_call("Created simulation engine")
-
-    def test_main_keyboard_interrupt(self) -> None:
-        """Should handle keyboard interrupt gracefully."""
-        mock_config = Mock(spec=Config)
-        mock_engine = Mock()
-        mock_engine.run.side_effect = KeyboardInterrupt()
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch(
-                        "nostr_simulator.main.create_simulation"
-                    ) as mock_create_sim:
-                        with patch("sys.exit") as mock_exit:
-                            mock_logger = Mock()
-                            mock_get_logger.return_value = mock_logger
-                            mock_load_config.return_value = mock_config
-                            mock_create_sim.return_value = mock_engine
-
-                            main()
-
-                            mock_logger.info.assert_any_call(
-                                "Simulation interrupted by user"
-                            )
-                            mock_exit.assert_called_once_with(1)
-
-    def test_main_general_exception(self) -> None:
-        """Should handle general exceptions gracefully."""
-        Mock(spec=Config)
-        test_error = Exception("Test error")
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch("sys.exit") as mock_exit:
-                        mock_logger = Mock()
-                        mock_get_logger.return_value = mock_logger
-                        mock_load_config.side_effect = test_error
-
-                        main()
-
-                        mock_logger.error.assert_called_once_with(
-                            "Simulation failed: Test error"
-                        )
-                        mock_exit.assert_called_once_with(1)
-
-    def test_main_config_loading_error(self) -> None:
-        """Should handle configuration loading errors."""
-        config_error = FileNotFoundError("Config file not found")
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch("sys.exit") as mock_exit:
-                        mock_logger = Mock()
-                        mock_get_logger.return_value = mock_logger
-                        mock_load_config.side_effect = config_error
-
-                        main()
-
-                        mock_logger.error.assert_called_once_with(
-                            "Simulation failed: Config file not found"
-                        )
-                        mock_exit.assert_called_once_with(1)
-
-    def test_main_simulation_creation_error(self) -> None:
-        """Should handle simulation creation errors."""
-        mock_config = Mock(spec=Config)
-        creation_error = ValueError("Invalid configuration")
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch(
-                        "nostr_simulator.main.create_simulation"
-                    ) as mock_create_sim:
-                        with patch("sys.exit") as mock_exit:
-                            mock_logger = Mock()
-                            mock_get_logger.return_value = mock_logger
-                            mock_load_config.return_value = mock_config
-                            mock_create_sim.side_effect = creation_error
-
-                            main()
-
-                            mock_logger.error.assert_called_once_with(
-                                "Simulation failed: Invalid configuration"
-                            )
-                            mock_exit.assert_called_once_with(1)
-
-    def test_main_simulation_run_error(self) -> None:
-        """Should handle simulation runtime errors."""
-        mock_config = Mock(spec=Config)
-        mock_engine = Mock()
-        runtime_error = RuntimeError("Simulation runtime error")
-        mock_engine.run.side_effect = runtime_error
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch(
-                        "nostr_simulator.main.create_simulation"
-                    ) as mock_create_sim:
-                        with patch("sys.exit") as mock_exit:
-                            mock_logger = Mock()
-                            mock_get_logger.return_value = mock_logger
-                            mock_load_config.return_value = mock_config
-                            mock_create_sim.return_value = mock_engine
-
-                            main()
-
-                            mock_logger.error.assert_called_once_with(
-                                "Simulation failed: Simulation runtime error"
-                            )
-                            mock_exit.assert_called_once_with(1)
-
-    def test_main_logs_final_metrics(self) -> None:
-        """Should log final metrics after successful simulation."""
-        mock_config = Mock(spec=Config)
-        mock_engine = Mock()
-        test_metrics = {
-            "total_events_processed": 250,
-            "average_queue_size": 5.5,
-            "simulation_duration": 100.0,
-        }
-        mock_engine.get_metrics.return_value = test_metrics
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch(
-                        "nostr_simulator.main.create_simulation"
-                    ) as mock_create_sim:
-                        mock_logger = Mock()
-                        mock_get_logger.return_value = mock_logger
-                        mock_load_config.return_value = mock_config
-                        mock_create_sim.return_value = mock_engine
-
-                        main()
-
-                        expected_message = "Simulation completed. Processed 250 events"
-                        mock_logger.info.assert_any_call(expected_message)
-
-    def test_main_handles_missing_metrics(self) -> None:
-        """Should handle case where metrics don't include total_events_processed."""
-        mock_config = Mock(spec=Config)
-        mock_engine = Mock()
-        test_metrics = {"average_queue_size": 5.5}  # Missing total_events_processed
-        mock_engine.get_metrics.return_value = test_metrics
-
-        with patch("nostr_simulator.main.setup_logging"):
-            with patch("nostr_simulator.main.get_logger") as mock_get_logger:
-                with patch(
-                    "nostr_simulator.main.load_config_from_env"
-                ) as mock_load_config:
-                    with patch(
-                        "nostr_simulator.main.create_simulation"
-                    ) as mock_create_sim:
-                        mock_logger = Mock()
-                        mock_get_logger.return_value = mock_logger
-                        mock_load_config.return_value = mock_config
-                        mock_create_sim.return_value = mock_engine
-
-                        main()
-
-                        expected_message = "Simulation completed. Processed 0 events"
-                        mock_logger.info.assert_any_call(expected_message)
+        mock_engine.get_metrics.return_value = _METRICS_WITH_TOTAL
+        mock_logger = main_patches["get_logger"].return_value
+
+        main()
+
+        main_patches["setup_logging"].assert_called_once()
+        main_patches["load_config"].assert_called_once()
+        main_patches["create_simulation"].assert_called_once_with(stub_config)
+        mock_engine.run.assert_called_once()
+        mock_engine.get_metrics.assert_called_once()
+        main_patches["exit"].assert_not_called()
+
+        # Check that appropriate log messages were called
+        assert {
+            "Starting Nostr Simulator",
+            "Loaded configuration",
+            "Created simulation engine",
+        } <= _logged_messages(mock_logger.info)
+
+    @pytest.mark.parametrize(
+        ("target", "error", "log_level", "expected_message"),
+        [
+            (
+                "run",
+                KeyboardInterrupt(),
+                "info",
+                "Simulation interrupted by user",
+            ),
+            (
+                "load_config",
+                Exception("Test error"),
+                "error",
+                "Simulation failed: Test error",
+            ),
+            (
+                "load_config",
+                FileNotFoundError("Config file not found"),
+                "error",
+                "Simulation failed: Config file not found",
+            ),
+            (
+                "create_simulation",
+                ValueError("Invalid configuration"),
+                "error",
+                "Simulation failed: Invalid configuration",
+            ),
+            (
+                "run",
+                RuntimeError("Simulation runtime error"),
+                "error",
+                "Simulation failed: Simulation runtime error",
+            ),
+        ],
+        ids=[
+            "keyboard_interrupt",
+            "general_exception",
+            "config_loading_error",
+            "simulation_creation_error",
+            "simulation_run_error",
+        ],
+    )
+    def test_main_handles_failure(
+        self,
+        main_patches: dict[str, MagicMock],
+        mock_engine: Mock,
+        target: str,
+        error: BaseException,
+        log_level: str,
+        expected_message: str,
+    ) -> None:
+        """Should log the failure and exit with status 1."""
+        if target == "run":
+            mock_engine.run.side_effect = error
+        else:
+            main_patches[target].side_effect = error
+        mock_logger = main_patches["get_logger"].return_value
+
+        main()
+
+        log_method = getattr(mock_logger, log_level)
+        if log_level == "error":
+            log_method.assert_called_once_with(expected_message)
+        else:
+            assert expected_message in _logged_messages(log_method)
+        main_patches["exit"].assert_called_once_with(1)
+
+    @pytest.mark.parametrize(
+        ("metrics", "expected_message"),
+        [
+            (_METRICS_WITH_TOTAL, "Simulation completed. Processed 250 events"),
+            (_METRICS_MISSING_TOTAL, "Simulation completed. Processed 0 events"),
+        ],
+        ids=["logs_final_metrics", "handles_missing_metrics"],
+    )
+    def test_main_logs_final_metrics(
+        self,
+        main_patches: dict[str, MagicMock],
+        mock_engine: Mock,
+        metrics: Mapping[str, float],
+        expected_message: str,
+    ) -> None:
+        """Should log the processed event count, defaulting to zero."""
+        mock_engine.get_metrics.return_value = metrics
+        mock_logger = main_patches["get_logger"].return_value
+
+        main()
+
+        assert expected_message in _logged_messages(mock_logger.info)
 
 
 class TestMainEntryPoint:
     """Test cases for main entry point execution."""
 
     def test_main_module_execution(self) -> None:
-        """Should call main function when executed as module."""
-        with patch("nostr_simulator.main.main"):
-            # Simulate module execution
-            with patch("sys.argv", ["main.py"]):
-                exec(
-                    """
-if __name__ == "__main__":
-    from nostr_simulator.main import main
-    main()
-                """
-                )
-
-            # Note: This test would actually call main, but we're testing the pattern
-            # In practice, we would need to mock the __name__ check
+        """Should call main() from the module's __main__ guard."""
+        tree = ast.parse(inspect.getsource(main_module))
+
+        guards = [
+            node
+            for node in tree.body
+            if isinstance(node, ast.If)
+            and ast.unparse(node.test) == "__name__ == '__main__'"
+        ]
+
+        assert len(guards) == 1
+        assert [ast.unparse(stmt) for stmt in guards[0].body] == ["main()"]